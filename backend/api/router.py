@@ -1,8 +1,10 @@
 """API routes for Living Chronicle."""
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import Response
 from pydantic import BaseModel
-from typing import Optional
+from typing import Any, Optional
+import orjson
 
 from ..services.simulation_manager import SimulationManager
 from ..services.grid_mapper import GridMapper
@@ -11,13 +13,32 @@ api_router = APIRouter()
 grid_mapper = GridMapper()
 
 
+# Set by the app lifespan; read directly so the dependency stays trivial
+_sim_manager: Optional[SimulationManager] = None
+
+
+def set_sim_manager(sim: Optional[SimulationManager]) -> None:
+    """Register the simulation manager served by these routes."""
+    global _sim_manager
+    _sim_manager = sim
+
+
 # Dependency to get simulation manager
 def get_sim_manager() -> SimulationManager:
     """Get the global simulation manager instance."""
-    from ..main import sim_manager
-    if sim_manager is None:
+    if _sim_manager is None:
         raise HTTPException(status_code=500, detail="Simulation manager not initialized")
-    return sim_manager
+    return _sim_manager
+
+
+def _json_response(payload: Any) -> Response:
+    """Serialize payload with orjson, bypassing FastAPI's jsonable_encoder."""
+    return _bytes_response(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY))
+
+
+def _bytes_response(content: bytes) -> Response:
+    """Wrap already-serialized JSON bytes in a response."""
+    return Response(content=content, media_type="application/json")
 
 
 # Request/Response models
@@ -53,7 +74,7 @@ async def initialize_simulation(
         raise HTTPException(status_code=500, detail=f"Failed to initialize: {str(e)}")
 
 
-@api_router.get("/state")
+@api_router.get("/state", response_model=None)
 async def get_state(sim: SimulationManager = Depends(get_sim_manager)):
     """Get current simulation state."""
     state = sim.get_current_state()
@@ -62,7 +83,7 @@ async def get_state(sim: SimulationManager = Depends(get_sim_manager)):
             status_code=400,
             detail="Simulation not initialized. Call /init first."
         )
-    return state
+    return _json_response(state)
 
 
 @api_router.post("/control")
@@ -86,7 +107,7 @@ async def control_simulation(
                 "day": sim.current_day,
             }
         elif req.action == "step":
-            result = sim.step()
+            result = await sim.step()
             return {
                 "status": "stepped",
                 "day": result.day,
@@ -110,79 +131,86 @@ async def control_simulation(
         raise HTTPException(status_code=500, detail=f"Control failed: {str(e)}")
 
 
-@api_router.get("/history/gods")
+@api_router.get("/history/gods", response_model=None)
 async def get_god_history(sim: SimulationManager = Depends(get_sim_manager)):
     """Get all gods (alive and dead) for history view."""
     try:
-        with sim._lock:
-            all_gods = sim.db.get_all_gods(alive_only=False)
-            return [
-                {
-                    "id": g.id,
-                    "name": g.name,
-                    "domain": g.domain,
-                    "birth_day": g.birth_day,
-                    "death_day": g.death_day,
-                    "alive": g.alive,
-                    "belief_strength": g.belief_strength,
-                    "coherence": g.coherence,
-                }
-                for g in all_gods
-            ]
+        return _bytes_response(sim.cached_for_day("history/gods", lambda: orjson.dumps([
+            {
+                "id": g.id,
+                "name": g.name,
+                "domain": g.domain,
+                "birth_day": g.birth_day,
+                "death_day": g.death_day,
+                "alive": g.alive,
+                "belief_strength": g.belief_strength,
+                "coherence": g.coherence,
+            }
+            for g in sim.db.get_all_gods(alive_only=False)
+        ])))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get gods: {str(e)}")
 
 
-@api_router.get("/history/myths")
+@api_router.get("/history/myths", response_model=None)
 async def get_myths(sim: SimulationManager = Depends(get_sim_manager)):
     """Get all myths."""
     try:
-        with sim._lock:
-            myths = sim.db.get_all_myths()
-            return [
-                {
-                    "id": m.id,
-                    "text": m.text,
-                    "domain": m.domain,
-                    "confidence": m.confidence,
-                    "day_created": m.day_created,
-                    "faction_id": m.faction_id,
-                }
-                for m in myths
-            ]
+        return _bytes_response(sim.cached_for_day("history/myths", lambda: orjson.dumps([
+            {
+                "id": m.id,
+                "text": m.text,
+                "domain": m.domain,
+                "confidence": m.confidence,
+                "day_created": m.day_created,
+                "faction_id": m.faction_id,
+            }
+            for m in sim.db.get_all_myths()
+        ])))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get myths: {str(e)}")
 
 
-@api_router.get("/grid")
+@api_router.get("/grid", response_model=None)
 async def get_grid(sim: SimulationManager = Depends(get_sim_manager)):
     """
     Get current 64x64 LED grid visualization.
 
-    Returns a 64x64 array of cells with color, brightness, and flicker data.
+    Returns column-oriented 64x64 arrays (indexed [y][x]): colors,
+    brightness, flicker and is_scar.
     """
     try:
-        state = sim.get_current_state()
-        if state is None:
+        # The grid only changes with the day, the age, or the scar set
+        cache_key = sim.grid_cache_key()
+        cached = sim.get_cached_grid(cache_key)
+        if cached is not None:
+            return _bytes_response(cached)
+
+        # Only beliefs feed the grid; skip building the full state. The
+        # inputs and their key are read together so a tick cannot land
+        # between them
+        inputs = sim.get_grid_inputs()
+        if inputs is None:
             raise HTTPException(
                 status_code=400,
                 detail="Simulation not initialized. Call /init first."
             )
-
-        # Import Age enum
-        from chronicle.sim.ages import Age
+        cache_key, beliefs, age, scar_mask = inputs
 
         # Map state to grid
         grid = grid_mapper.map_state_to_grid(
-            citizens=state["citizens"],
-            gods=state["gods"],
-            factions=state["factions"],
-            age=Age(state["age"]),
-            historical_scars=sim.get_historical_scars()
+            beliefs=beliefs,
+            age=age,
+            scar_mask=scar_mask
         )
 
         # Convert to JSON
-        return grid_mapper.grid_to_json(grid)
+        payload = orjson.dumps(
+            grid_mapper.grid_to_json(grid),
+            option=orjson.OPT_SERIALIZE_NUMPY,
+        )
+        sim.cache_grid(cache_key, payload)
+        return _bytes_response(payload)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid state: {str(e)}")
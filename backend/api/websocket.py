@@ -1,45 +1,226 @@
 """WebSocket handler for real-time tick streaming."""
 
 import asyncio
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Any
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
+from typing import Any, Optional, Union
+import msgpack
+import orjson
 
 from ..services.simulation_manager import SimulationManager
+from .router import get_sim_manager
+from chronicle.sim.engine import TickResult
 
 ws_router = APIRouter()
 
+# Per-client backlog; when a client falls this far behind, its oldest
+# pending tick is dropped rather than letting the queue grow unbounded
+CLIENT_QUEUE_SIZE = 64
+
+# Send a full "tick" frame at least this often so clients that dropped a
+# delta can resync
+KEYFRAME_INTERVAL = 60
+
+# Tick encodings a client can pick with {"subscribe": "<format>"}
+FORMAT_JSON = "json"  # text frames
+FORMAT_MSGPACK = "msgpack"  # binary frames
+TICK_FORMATS = (FORMAT_JSON, FORMAT_MSGPACK)
+
+Frame = Union[str, bytes]
+
+
+def _tick_data(result: TickResult) -> dict[str, Any]:
+    """Build the websocket tick payload for a tick result."""
+    return {
+        "day": result.day,
+        "age": result.age.value,
+        "event": {
+            "name": result.event.name,
+            "description": result.event.description,
+            "domain": result.event.primary_domain,
+            "magnitude": result.event.magnitude if hasattr(result.event, 'magnitude') else None,
+        } if result.event else None,
+        "born_gods": [
+            {
+                "name": g.row.name,
+                "domain": g.row.domain,
+            }
+            for g in result.born_gods
+        ],
+        "faded_gods": [
+            {
+                "name": g.row.name,
+                "domain": g.row.domain,
+            }
+            for g in result.faded_gods
+        ],
+        "age_transition": result.age_transition.value if result.age_transition else None,
+        "new_myths": [
+            {
+                "text": m.row.text,
+                "domain": m.row.domain,
+                "confidence": m.row.confidence,
+            }
+            for m in result.new_myths
+        ],
+    }
+
+
+def _keyframe(payload: dict[str, Any]) -> dict[str, Any]:
+    """Build a full tick message."""
+    return {"type": "tick", "data": payload}
+
+
+def _serialize(message: dict[str, Any], fmt: str) -> Frame:
+    """Serialize a message as a text (JSON) or binary (msgpack) frame."""
+    if fmt == FORMAT_MSGPACK:
+        return msgpack.packb(message)
+    return orjson.dumps(message).decode()
+
 
 class ConnectionManager:
-    """Manages WebSocket connections for tick broadcasting."""
+    """
+    Manages WebSocket connections for tick broadcasting.
+
+    Each connection gets its own bounded queue drained by a dedicated
+    writer task, so a slow client never delays delivery to the others.
+    Messages are serialized once per broadcast and format, and the same
+    frame is queued for every client using that format. Clients get JSON
+    text frames unless they subscribe to msgpack binary frames.
+
+    Ticks are delta-encoded: after a full ``tick`` frame, each following
+    tick is sent as ``tick-delta`` carrying only the fields that differ
+    from the previous tick. Clients rebuild the full payload by merging
+    ``changed`` into the last one. A full frame is re-sent every
+    ``KEYFRAME_INTERVAL`` ticks and to each newly connected client.
+    """
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: dict[WebSocket, asyncio.Queue] = {}
+        self._writers: dict[WebSocket, asyncio.Task] = {}
+        self._formats: dict[WebSocket, str] = {}
+        # Clients that lost a queued frame, or switched format, and need a
+        # full tick before their next delta
+        self._needs_keyframe: set[WebSocket] = set()
+        self._last_tick_payload: Optional[dict[str, Any]] = None
+        self._ticks_since_keyframe = 0
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and register a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        if self._last_tick_payload is not None:
+            # Give the client a base to apply the next delta to
+            fmt = self._formats.get(websocket, FORMAT_JSON)
+            queue.put_nowait(_serialize(_keyframe(self._last_tick_payload), fmt))
+        self.active_connections[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
         print(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket) -> None:
         """Unregister a WebSocket connection."""
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+            del self.active_connections[websocket]
+            self._formats.pop(websocket, None)
+            self._needs_keyframe.discard(websocket)
+            writer = self._writers.pop(websocket, None)
+            if writer is not None and writer is not asyncio.current_task():
+                writer.cancel()
             print(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
-    async def broadcast(self, message: dict[str, Any]) -> None:
-        """Broadcast message to all connected clients."""
-        disconnected = []
-        for connection in self.active_connections:
+    def set_format(self, websocket: WebSocket, fmt: str) -> None:
+        """Choose the tick encoding for one client."""
+        if fmt not in TICK_FORMATS:
+            raise ValueError(f"Unknown tick format: {fmt}")
+        if websocket in self.active_connections:
+            if self._formats.get(websocket, FORMAT_JSON) != fmt:
+                # Restart the delta chain in the new encoding
+                self._needs_keyframe.add(websocket)
+            self._formats[websocket] = fmt
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue) -> None:
+        """Send queued frames to one client until it goes away."""
+        while True:
+            frame = await queue.get()
             try:
-                await connection.send_json(message)
+                if isinstance(frame, bytes):
+                    await websocket.send_bytes(frame)
+                else:
+                    await websocket.send_text(frame)
             except Exception as e:
                 print(f"Error sending to WebSocket: {e}")
-                disconnected.append(connection)
+                self.disconnect(websocket)
+                return
+
+    def _enqueue(self, websocket: WebSocket, queue: asyncio.Queue, frame: Frame) -> None:
+        """
+        Queue a frame, dropping the oldest pending one if the client is behind.
+
+        A dropped frame may be a delta the later ones build on, so the
+        client is flagged to get a keyframe on the next tick.
+        """
+        if queue.full():
+            queue.get_nowait()
+            self._needs_keyframe.add(websocket)
+        queue.put_nowait(frame)
+
+    def send(self, websocket: WebSocket, frame: Frame) -> None:
+        """
+        Queue a frame for one client.
 
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+        The connection's writer task is its only sender, so replies go
+        through the queue and stay ordered with tick frames.
+        """
+        queue = self.active_connections.get(websocket)
+        if queue is not None:
+            self._enqueue(websocket, queue, frame)
+
+    def broadcast(self, message: dict[str, Any], keyframe: Optional[dict[str, Any]] = None) -> None:
+        """
+        Serialize a message once per format and queue it for every client.
+
+        If keyframe is given, clients flagged as needing one get it in
+        place of message.
+        """
+        frames: dict[tuple[bool, str], Frame] = {}
+        for websocket, queue in self.active_connections.items():
+            fmt = self._formats.get(websocket, FORMAT_JSON)
+            full = keyframe is not None and websocket in self._needs_keyframe
+            if full:
+                self._needs_keyframe.discard(websocket)
+            frame = frames.get((full, fmt))
+            if frame is None:
+                frame = frames[full, fmt] = _serialize(keyframe if full else message, fmt)
+            self._enqueue(websocket, queue, frame)
+
+    def _encode_tick(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Build a tick message: a keyframe or a delta against the previous tick."""
+        previous = self._last_tick_payload
+        self._last_tick_payload = payload
+
+        if previous is None or self._ticks_since_keyframe >= KEYFRAME_INTERVAL:
+            self._ticks_since_keyframe = 0
+            return _keyframe(payload)
+
+        self._ticks_since_keyframe += 1
+        changed = {k: v for k, v in payload.items() if previous.get(k) != v}
+        return {
+            "type": "tick-delta",
+            "day": payload["day"],
+            "changed": changed,
+        }
+
+    async def broadcast_tick(self, result: TickResult) -> None:
+        """Simulation subscriber: encode a tick and queue it for every client."""
+        if not self.active_connections:
+            # Nobody to send to; deltas resume from the last payload sent
+            return
+        try:
+            payload = _tick_data(result)
+            message = self._encode_tick(payload)
+            keyframe = message if message["type"] == "tick" else _keyframe(payload)
+            self.broadcast(message, keyframe)
+        except Exception as e:
+            print(f"Error in broadcast_tick: {e}")
 
     @property
     def connection_count(self) -> int:
@@ -51,109 +232,76 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 
+def _subscribe_format(data: str) -> Optional[str]:
+    """Parse a {"subscribe": "<format>"} request, or None if it is not one."""
+    try:
+        request = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return None
+    if isinstance(request, dict) and request.get("subscribe") in TICK_FORMATS:
+        return request["subscribe"]
+    return None
+
+
 @ws_router.websocket("/ws/ticks")
-async def websocket_endpoint(websocket: WebSocket):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    sim_manager: SimulationManager = Depends(get_sim_manager)
+):
     """
     WebSocket endpoint for real-time tick updates.
 
     Clients connect to this endpoint to receive simulation tick events as they occur.
     Each tick broadcasts: day, age, event, born gods, faded gods, age transitions.
+    Ticks arrive as a full "tick" frame followed by "tick-delta" frames
+    holding only the fields that changed since the previous tick.
+    Send {"subscribe": "msgpack"} to receive ticks as msgpack binary frames
+    instead of JSON text ({"subscribe": "json"} switches back).
     """
-    from ..main import sim_manager
-
     await manager.connect(websocket)
 
-    # Get the current event loop for this WebSocket connection
-    loop = asyncio.get_event_loop()
-
-    # Create async callback to broadcast tick results
-    def broadcast_tick(result):
-        """Callback to broadcast tick results to all connected clients."""
-        try:
-            message = {
-                "type": "tick",
-                "data": {
-                    "day": result.day,
-                    "age": result.age.value,
-                    "event": {
-                        "name": result.event.name,
-                        "description": result.event.description,
-                        "domain": result.event.primary_domain,
-                        "magnitude": result.event.magnitude if hasattr(result.event, 'magnitude') else None,
-                    } if result.event else None,
-                    "born_gods": [
-                        {
-                            "name": g.row.name,
-                            "domain": g.row.domain,
-                        }
-                        for g in result.born_gods
-                    ],
-                    "faded_gods": [
-                        {
-                            "name": g.row.name,
-                            "domain": g.row.domain,
-                        }
-                        for g in result.faded_gods
-                    ],
-                    "age_transition": result.age_transition.value if result.age_transition else None,
-                    "new_myths": [
-                        {
-                            "text": m.row.text,
-                            "domain": m.row.domain,
-                            "confidence": m.row.confidence,
-                        }
-                        for m in result.new_myths
-                    ],
-                }
-            }
-
-            # Schedule the async broadcast in the WebSocket's event loop
-            async def do_broadcast():
-                await manager.broadcast(message)
-
-            asyncio.run_coroutine_threadsafe(do_broadcast(), loop)
-
-        except Exception as e:
-            print(f"Error in broadcast_tick: {e}")
-
-    # Use the synchronous callback
-    tick_callback = broadcast_tick
-
-    # Subscribe to simulation tick events
-    sim_manager.subscribe(tick_callback)
+    # One subscription feeds every connection
+    if manager.connection_count == 1:
+        sim_manager.subscribe(manager.broadcast_tick)
 
     try:
         # Keep connection alive and handle client messages
         while True:
             data = await websocket.receive_text()
 
-            # Handle client messages
+            # Handle client messages; replies are queued behind pending ticks
             if data == "ping":
-                await websocket.send_text("pong")
+                manager.send(websocket, "pong")
+            elif data.startswith("{") and (fmt := _subscribe_format(data)) is not None:
+                manager.set_format(websocket, fmt)
+                manager.send(websocket, _serialize({
+                    "type": "subscribed",
+                    "format": fmt,
+                }, FORMAT_JSON))
             elif data == "status":
-                await websocket.send_json({
+                manager.send(websocket, _serialize({
                     "type": "status",
                     "data": {
                         "day": sim_manager.current_day,
                         "running": sim_manager.is_running,
                         "connections": manager.connection_count,
                     }
-                })
+                }, FORMAT_JSON))
             else:
                 # Echo unknown messages
-                await websocket.send_json({
+                manager.send(websocket, _serialize({
                     "type": "echo",
                     "data": data,
-                })
+                }, FORMAT_JSON))
 
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
-        sim_manager.unsubscribe(tick_callback)
         print("WebSocket client disconnected normally")
     except Exception as e:
         print(f"WebSocket error: {e}")
+    finally:
         manager.disconnect(websocket)
-        sim_manager.unsubscribe(tick_callback)
+        if manager.connection_count == 0:
+            sim_manager.unsubscribe(manager.broadcast_tick)
 
 
 @ws_router.get("/ws/status")
@@ -2,10 +2,11 @@
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from .services.simulation_manager import SimulationManager
-from .api.router import api_router
+from .api.router import api_router, set_sim_manager
 from .api.websocket import ws_router
 
 # Global simulation manager
@@ -17,7 +18,9 @@ async def lifespan(app: FastAPI):
     """Manage application lifecycle."""
     global sim_manager
     sim_manager = SimulationManager(db_path="chronicle.db")
+    set_sim_manager(sim_manager)
     yield
+    set_sim_manager(None)
     if sim_manager:
         sim_manager.shutdown()
 
@@ -26,6 +29,7 @@ app = FastAPI(
     title="Living Chronicle API",
     version="0.1.0",
     description="Web API for the Living Chronicle mythic civilization simulator",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -1,8 +1,8 @@
 """Maps simulation state to 64x64 LED grid."""
 
 from dataclasses import dataclass
-from typing import Any
-import statistics
+
+import numpy as np
 
 from chronicle.sim.ages import Age
 from chronicle.data.models import DOMAINS
@@ -17,17 +17,45 @@ DOMAIN_COLORS = {
     "memory": (160, 100, 200),    # Violet - archives, past
 }
 
+# Base flicker intensity per age (see GridMapper._calculate_flicker)
+AGE_BASE_FLICKER = {
+    Age.EMERGENCE: 0.15,
+    Age.ORDER: 0.05,
+    Age.STRAIN: 0.4,
+    Age.COLLAPSE: 0.8,
+    Age.SILENCE: 0.1,
+    Age.REBIRTH: 0.3,
+}
+
+# Domain -> row index, and the colors as a (domains, 3) lookup table
+DOMAIN_IDX = {domain: i for i, domain in enumerate(DOMAINS)}
+DOMAIN_COLORS_ARR = np.array([DOMAIN_COLORS[d] for d in DOMAINS], dtype=np.uint8)
+
 
 @dataclass
-class GridCell:
-    """Represents a single LED cell in the 64x64 grid."""
-    x: int
-    y: int
-    domain: str
-    color: tuple[int, int, int]  # RGB
-    brightness: float  # 0.0-1.0
-    flicker_intensity: float  # 0.0-1.0
-    is_scar: bool = False
+class GridFrame:
+    """
+    Column-oriented 64x64 grid: one array per cell attribute, indexed [y, x].
+
+    Serializes in a single pass with orjson's numpy support instead of one
+    dict per cell.
+    """
+    domain: np.ndarray  # uint8 index into DOMAINS
+    colors: np.ndarray  # uint8 RGB, shape (64, 64, 3)
+    brightness: np.ndarray  # float32 0.0-1.0
+    flicker: np.ndarray  # float32 0.0-1.0
+    is_scar: np.ndarray  # bool
+
+    @classmethod
+    def empty(cls, size: int) -> "GridFrame":
+        """Allocate a zeroed frame for a size x size grid."""
+        return cls(
+            domain=np.zeros((size, size), dtype=np.uint8),
+            colors=np.zeros((size, size, 3), dtype=np.uint8),
+            brightness=np.zeros((size, size), dtype=np.float32),
+            flicker=np.zeros((size, size), dtype=np.float32),
+            is_scar=np.zeros((size, size), dtype=np.bool_),
+        )
 
 
 class GridMapper:
@@ -52,159 +80,99 @@ class GridMapper:
 
     def map_state_to_grid(
         self,
-        citizens: list[dict[str, Any]],
-        gods: list[dict[str, Any]],
-        factions: list[dict[str, Any]],
+        beliefs: np.ndarray,
         age: Age,
-        historical_scars: dict[tuple[int, int], dict[str, Any]]
-    ) -> list[list[GridCell]]:
+        scar_mask: np.ndarray
+    ) -> GridFrame:
         """
         Map simulation state to 64x64 grid.
 
-        Returns 2D array of GridCell objects.
+        beliefs is a (citizens, domains) matrix with columns in DOMAINS order.
+        scar_mask is a 64x64 boolean array of historical scars, indexed [y, x].
+        Returns a GridFrame of per-attribute arrays.
         """
         # Initialize grid
-        grid = [[None for _ in range(self.GRID_SIZE)] for _ in range(self.GRID_SIZE)]
+        grid = GridFrame.empty(self.GRID_SIZE)
 
         # Create region map (8x8 regions)
-        regions = self._create_region_map(citizens, factions)
-
-        # Fill grid based on regions
-        for region_x in range(self.REGION_SIZE):
-            for region_y in range(self.REGION_SIZE):
-                region_key = (region_x, region_y)
-                region_data = regions.get(region_key, {
-                    "domain": "memory",
-                    "brightness": 0.1,
-                    "coherence": 0.0,
-                })
-
-                # Fill 8x8 cells for this region
-                start_x = region_x * self.CELLS_PER_REGION
-                start_y = region_y * self.CELLS_PER_REGION
-
-                for dx in range(self.CELLS_PER_REGION):
-                    for dy in range(self.CELLS_PER_REGION):
-                        cell_x = start_x + dx
-                        cell_y = start_y + dy
-
-                        # Check if this is a historical scar
-                        is_scar = (cell_x, cell_y) in historical_scars
-
-                        # Calculate flicker based on age and coherence
-                        flicker = self._calculate_flicker(
-                            age,
-                            region_data["coherence"],
-                            is_scar
-                        )
-
-                        # Adjust brightness for age effects
-                        brightness = self._adjust_brightness_for_age(
-                            age,
-                            region_data["brightness"],
-                            is_scar
-                        )
-
-                        domain = region_data["domain"]
-                        color = DOMAIN_COLORS[domain]
-
-                        grid[cell_y][cell_x] = GridCell(
-                            x=cell_x,
-                            y=cell_y,
-                            domain=domain,
-                            color=color,
-                            brightness=brightness,
-                            flicker_intensity=flicker,
-                            is_scar=is_scar,
-                        )
+        beliefs = np.asarray(beliefs).reshape(-1, len(DOMAINS))
+        region_domain, region_brightness, region_coherence = self._create_region_map(beliefs)
+
+        # Write region values straight into the preallocated cell arrays
+        # (each region covers 8x8 cells), then apply per-cell scar effects
+        self._fill_regions(grid.domain, region_domain)
+        self._fill_regions(grid.colors, DOMAIN_COLORS_ARR[region_domain])
+        self._adjust_brightness_for_age(age, region_brightness, scar_mask, out=grid.brightness)
+        self._calculate_flicker(age, region_coherence, scar_mask, out=grid.flicker)
+        grid.is_scar[...] = scar_mask
 
         return grid
 
+    def _fill_regions(self, out: np.ndarray, region_values: np.ndarray) -> None:
+        """Broadcast an [region_y, region_x] array into a [y, x] cell array in place."""
+        regions, cells = self.REGION_SIZE, self.CELLS_PER_REGION
+        # [y, x, ...] viewed as [region_y, dy, region_x, dx, ...]
+        blocks = out.reshape(regions, cells, regions, cells, *out.shape[2:])
+        blocks[...] = region_values[:, None, :, None]
+
     def _create_region_map(
         self,
-        citizens: list[dict[str, Any]],
-        factions: list[dict[str, Any]]
-    ) -> dict[tuple[int, int], dict[str, Any]]:
+        beliefs: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
-        Create region map from citizen beliefs.
+        Create region map from a (citizens, domains) belief matrix.
 
         Strategy: Assign citizens to regions spatially, aggregate beliefs.
+        Region i = region_y * REGION_SIZE + region_x takes the i-th block of
+        citizens_per_region rows. Since citizens_per_region is
+        citizen_count // 64 (min 1), only whole blocks are ever assigned;
+        regions past the last block stay at the low-memory default.
+
+        Returns (domain index, brightness, coherence), each indexed
+        [region_y, region_x].
         """
-        regions = {}
-
-        # Handle empty citizen list
-        if not citizens:
-            # Return default regions with low memory belief
-            for region_x in range(self.REGION_SIZE):
-                for region_y in range(self.REGION_SIZE):
-                    regions[(region_x, region_y)] = {
-                        "domain": "memory",
-                        "brightness": 0.1,
-                        "coherence": 0.0,
-                    }
-            return regions
-
-        citizen_count = len(citizens)
-        citizens_per_region = max(1, citizen_count // (self.REGION_SIZE ** 2))
-
-        for region_x in range(self.REGION_SIZE):
-            for region_y in range(self.REGION_SIZE):
-                region_key = (region_x, region_y)
-
-                # Get citizens for this region (spatially distributed)
-                start_idx = (region_y * self.REGION_SIZE + region_x) * citizens_per_region
-                end_idx = min(start_idx + citizens_per_region, citizen_count)
-                region_citizens = citizens[start_idx:end_idx]
-
-                if not region_citizens:
-                    # Empty region - default to low memory
-                    regions[region_key] = {
-                        "domain": "memory",
-                        "brightness": 0.1,
-                        "coherence": 0.0,
-                    }
-                    continue
-
-                # Aggregate beliefs across all domains
-                domain_totals = {d: 0.0 for d in DOMAINS}
-                for citizen in region_citizens:
-                    for domain, belief in citizen["beliefs"].items():
-                        domain_totals[domain] += belief
-
-                # Find dominant domain
-                dominant_domain = max(domain_totals.items(), key=lambda x: x[1])[0]
-                total_belief = domain_totals[dominant_domain]
-                avg_belief = total_belief / len(region_citizens)
-
-                # Calculate coherence (how unified beliefs are)
-                # Coherence = 1 - variance (scaled)
-                beliefs_in_domain = [
-                    c["beliefs"].get(dominant_domain, 0.0)
-                    for c in region_citizens
-                ]
-
-                if len(beliefs_in_domain) > 1:
-                    variance = statistics.variance(beliefs_in_domain)
-                    coherence = max(0.0, 1.0 - variance * 4)
-                else:
-                    coherence = 1.0
-
-                regions[region_key] = {
-                    "domain": dominant_domain,
-                    "brightness": min(1.0, avg_belief),
-                    "coherence": coherence,
-                }
-
-        return regions
+        region_count = self.REGION_SIZE ** 2
+        domain_idx = np.full(region_count, DOMAIN_IDX["memory"], dtype=np.uint8)
+        brightness = np.full(region_count, 0.1)
+        coherence = np.zeros(region_count)
+
+        citizen_count = len(beliefs)
+        if citizen_count:
+            citizens_per_region = max(1, citizen_count // region_count)
+            filled = min(region_count, citizen_count // citizens_per_region)
+            blocks = beliefs[:filled * citizens_per_region].reshape(
+                filled, citizens_per_region, len(DOMAINS)
+            )
+
+            # Dominant domain = largest summed belief (first wins ties)
+            totals = blocks.sum(axis=1)
+            dominant = totals.argmax(axis=1)
+            domain_idx[:filled] = dominant
+            avg_belief = totals[np.arange(filled), dominant] / citizens_per_region
+            brightness[:filled] = np.minimum(1.0, avg_belief)
+
+            # Coherence = 1 - sample variance of the dominant domain (scaled)
+            if citizens_per_region > 1:
+                dominant_beliefs = np.take_along_axis(
+                    blocks, dominant[:, None, None], axis=2
+                )[..., 0]
+                variance = dominant_beliefs.var(axis=1, ddof=1)
+                coherence[:filled] = np.maximum(0.0, 1.0 - variance * 4)
+            else:
+                coherence[:filled] = 1.0
+
+        shape = (self.REGION_SIZE, self.REGION_SIZE)
+        return domain_idx.reshape(shape), brightness.reshape(shape), coherence.reshape(shape)
 
     def _calculate_flicker(
         self,
         age: Age,
-        coherence: float,
-        is_scar: bool
-    ) -> float:
+        region_coherence: np.ndarray,
+        is_scar: np.ndarray,
+        out: np.ndarray
+    ) -> None:
         """
-        Calculate flicker intensity for a cell.
+        Write flicker intensity for every cell into out.
 
         Flicker represents instability and ideological conflict.
 
@@ -218,69 +186,56 @@ class GridMapper:
 
         Low coherence increases flicker (+0.2 max)
         """
-        if is_scar and age == Age.SILENCE:
-            return 0.2  # Persistent faint flicker on scars
-
-        base_flicker = {
-            Age.EMERGENCE: 0.15,
-            Age.ORDER: 0.05,
-            Age.STRAIN: 0.4,
-            Age.COLLAPSE: 0.8,
-            Age.SILENCE: 0.1,
-            Age.REBIRTH: 0.3,
-        }[age]
+        base_flicker = AGE_BASE_FLICKER[age]
 
         # Low coherence increases flicker
-        coherence_factor = (1.0 - coherence) * 0.2
+        self._fill_regions(out, np.minimum(1.0, base_flicker + (1.0 - region_coherence) * 0.2))
 
-        return min(1.0, base_flicker + coherence_factor)
+        if age == Age.SILENCE:
+            # Persistent faint flicker on scars
+            np.copyto(out, 0.2, where=is_scar)
 
     def _adjust_brightness_for_age(
         self,
         age: Age,
-        base_brightness: float,
-        is_scar: bool
-    ) -> float:
+        region_brightness: np.ndarray,
+        is_scar: np.ndarray,
+        out: np.ndarray
+    ) -> None:
         """
-        Adjust brightness based on age.
+        Write age-adjusted brightness for every cell into out.
 
         Age modifiers:
         - Collapse: Grid dims to 40% (world darkens)
         - Silence: Dims to 10% except scars which stay at 30%
         - Rebirth: Scars glow brighter at 150%
         """
-        brightness = base_brightness
-
         if age == Age.COLLAPSE:
             # Grid darkens during collapse
-            return brightness * 0.4
+            self._fill_regions(out, region_brightness * 0.4)
+            return
+
+        self._fill_regions(out, region_brightness)
 
         if age == Age.SILENCE:
             # Most of grid goes dark, scars remain faintly visible
-            if is_scar:
-                return max(brightness, 0.3)
-            return brightness * 0.1
+            np.maximum(out, 0.3, out=out, where=is_scar)
+            np.multiply(out, 0.1, out=out, where=~is_scar)
 
-        if age == Age.REBIRTH and is_scar:
+        elif age == Age.REBIRTH:
             # Scars glow brighter during rebirth
-            return min(1.0, brightness * 1.5)
-
-        return brightness
-
-    def grid_to_json(self, grid: list[list[GridCell]]) -> list[list[dict[str, Any]]]:
-        """Convert grid to JSON-serializable format."""
-        return [
-            [
-                {
-                    "x": cell.x,
-                    "y": cell.y,
-                    "domain": cell.domain,
-                    "color": list(cell.color),  # Convert tuple to list for JSON
-                    "brightness": cell.brightness,
-                    "flicker": cell.flicker_intensity,
-                    "is_scar": cell.is_scar,
-                }
-                for cell in row
-            ]
-            for row in grid
-        ]
+            np.multiply(out, 1.5, out=out, where=is_scar)
+            np.minimum(out, 1.0, out=out, where=is_scar)
+
+    def grid_to_json(self, grid: GridFrame) -> dict[str, np.ndarray]:
+        """
+        Convert grid to a column-oriented payload.
+
+        Arrays are indexed [y][x]; serialize with orjson.OPT_SERIALIZE_NUMPY.
+        """
+        return {
+            "colors": grid.colors,
+            "brightness": grid.brightness,
+            "flicker": grid.flicker,
+            "is_scar": grid.is_scar,
+        }
@@ -1,10 +1,13 @@
 """Thread-safe wrapper for SimulationEngine."""
 
+import asyncio
+import hashlib
 import threading
-import time
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Awaitable
 from dataclasses import asdict
 
+import numpy as np
+
 from chronicle.data import Database
 from chronicle.sim import SimulationEngine
 from chronicle.sim.engine import TickResult
@@ -17,7 +20,7 @@ class SimulationManager:
 
     Key responsibilities:
     - Wrap SimulationEngine for concurrent access
-    - Manage tick execution in background thread
+    - Drive automatic ticking from an asyncio task on the app event loop
     - Broadcast tick results to WebSocket subscribers
     - Maintain historical scar positions across cycles
     """
@@ -30,75 +33,102 @@ class SimulationManager:
         # Simulation control
         self._lock = threading.Lock()
         self._running = False
-        self._tick_thread: Optional[threading.Thread] = None
+        self._tick_task: Optional[asyncio.Task] = None
         self._tick_delay = 1.0  # seconds between ticks
 
-        # WebSocket subscribers
-        self._subscribers: list[Callable[[TickResult], None]] = []
+        # WebSocket subscribers (async callables awaited on the event loop)
+        self._subscribers: set[Callable[[TickResult], Awaitable[None]]] = set()
 
         # Historical scars tracking (for LED display)
         self._historical_scars: dict[tuple[int, int], dict[str, Any]] = {}
+        self._scar_mask = np.zeros((64, 64), dtype=np.bool_)  # [y, x]
+        self._scar_version = 0  # bumped whenever the scar set changes
+
+        # Last serialized /grid payload, keyed by grid_cache_key()
+        self._grid_cache: Optional[tuple[tuple[int, str, int], bytes]] = None
+
+        # Per-day results of DB reads that cannot change until the next tick
+        self._day_cache: dict[str, tuple[int, Any]] = {}
+
+        # Immutable state published once per tick; readers skip the lock
+        self._snapshot: Optional[dict[str, Any]] = None
 
     def initialize(self, fresh: bool = False, seed: int = 42) -> None:
         """Initialize or restore simulation."""
         with self._lock:
             self.engine = SimulationEngine(self.db, seed=seed)
             self.engine.initialize(fresh=fresh)
+            self._grid_cache = None
+            self._day_cache.clear()
+            self._publish_snapshot()
 
             if fresh:
                 self._historical_scars.clear()
+                self._scar_mask.fill(False)
+                self._scar_version += 1
 
-    def subscribe(self, callback: Callable[[TickResult], None]) -> None:
+    def subscribe(self, callback: Callable[[TickResult], Awaitable[None]]) -> None:
         """Subscribe to tick updates."""
-        self._subscribers.append(callback)
+        self._subscribers.add(callback)
 
-    def unsubscribe(self, callback: Callable[[TickResult], None]) -> None:
+    def unsubscribe(self, callback: Callable[[TickResult], Awaitable[None]]) -> None:
         """Unsubscribe from tick updates."""
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        self._subscribers.discard(callback)
 
-    def _broadcast_tick(self, result: TickResult) -> None:
+    async def _broadcast_tick(self, result: TickResult) -> None:
         """Broadcast tick result to all subscribers."""
-        for callback in self._subscribers[:]:  # Copy list to avoid modification during iteration
+        # Snapshot: awaiting a callback may let another task (un)subscribe
+        for callback in tuple(self._subscribers):
             try:
-                callback(result)
+                await callback(result)
             except Exception as e:
                 print(f"Error broadcasting to subscriber: {e}")
 
     def start(self, speed: float = 1.0) -> None:
-        """Start automatic ticking."""
+        """Start automatic ticking (must be called from the event loop)."""
         if self._running:
             return
 
         self._running = True
         self._tick_delay = 1.0 / speed
-        self._tick_thread = threading.Thread(target=self._tick_loop, daemon=True)
-        self._tick_thread.start()
+        self._tick_task = asyncio.get_running_loop().create_task(self._tick_loop())
 
     def stop(self) -> None:
         """Stop automatic ticking."""
         self._running = False
-        if self._tick_thread:
-            self._tick_thread.join(timeout=2.0)
-            self._tick_thread = None
+        if self._tick_task:
+            self._tick_task.cancel()
+            self._tick_task = None
+
+    async def step(self) -> TickResult:
+        """Execute single tick, broadcast it and return the result."""
+        # Only the CPU/DB work leaves the event loop; subscribers are
+        # awaited here directly
+        result = await asyncio.to_thread(self._advance)
+        if self._subscribers:
+            await self._broadcast_tick(result)
+        return result
 
-    def step(self) -> TickResult:
-        """Execute single tick and return result."""
+    def _advance(self) -> TickResult:
+        """Run one engine tick under the lock."""
         with self._lock:
             if not self.engine:
                 raise RuntimeError("Simulation not initialized")
 
             result = self.engine.tick()
+            self._day_cache.clear()
             self._update_historical_scars(result)
-            self._broadcast_tick(result)
+            self._publish_snapshot()
             return result
 
-    def _tick_loop(self) -> None:
-        """Background thread for automatic ticking."""
+    async def _tick_loop(self) -> None:
+        """Event loop task for automatic ticking."""
         while self._running:
             try:
-                self.step()
-                time.sleep(self._tick_delay)
+                await self.step()
+                await asyncio.sleep(self._tick_delay)
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 print(f"Error in tick loop: {e}")
                 self._running = False
@@ -115,72 +145,163 @@ class SimulationManager:
                     "domain": god.row.domain,
                     "death_day": result.day,
                 }
+                self._scar_mask[y, x] = True
+                self._scar_version += 1
 
         # Clear scars on new Emergence
         if result.age_transition and result.age_transition == Age.EMERGENCE:
-            self._historical_scars.clear()
+            if self._historical_scars:
+                self._historical_scars.clear()
+                self._scar_mask.fill(False)
+                self._scar_version += 1
 
     def _god_to_position(self, god) -> tuple[int, int]:
-        """Map god to deterministic grid position based on name hash."""
-        name_hash = hash(god.row.name)
-        x = name_hash % 64
-        y = (name_hash // 64) % 64
+        """
+        Map god to deterministic grid position based on name hash.
+
+        Uses BLAKE2b rather than hash(), which is salted per process
+        (PYTHONHASHSEED) and would move scars between runs and workers.
+        """
+        digest = hashlib.blake2b(god.row.name.encode("utf-8"), digest_size=8).digest()
+        name_hash = int.from_bytes(digest, "little")
+        x = name_hash & 0x3F
+        y = (name_hash >> 6) & 0x3F
         return (x, y)
 
     def get_current_state(self) -> Optional[dict[str, Any]]:
-        """Get current simulation state snapshot."""
+        """
+        Get current simulation state snapshot.
+
+        Lock-free: returns the snapshot published after the last tick. It is
+        shared between callers and must not be mutated.
+        """
+        return self._snapshot
+
+    def _publish_snapshot(self) -> None:
+        """Build and publish the state snapshot for the current day (lock held)."""
+        self._snapshot = {
+            "day": self.engine.current_day,
+            "age": self.engine.age_manager.current_age.value,
+            "age_day": self.engine.age_manager.day_counter,
+            "seed": self.engine.seed,
+            "citizens": [
+                {
+                    "id": c.row.id,
+                    "name": c.row.name,
+                    "faction_id": c.row.faction_id,
+                    "beliefs": dict(c.row.belief_vector),
+                    "fear": c.row.fear,
+                    "gratitude": c.row.gratitude,
+                    "alive": c.row.alive,
+                }
+                for c in self.engine.get_citizens()
+            ],
+            "factions": [
+                {
+                    "id": f.row.id,
+                    "name": f.row.name,
+                    "doctrine": dict(f.row.doctrine_bias),
+                }
+                for f in self.engine.get_factions()
+            ],
+            "gods": [
+                {
+                    "id": g.row.id,
+                    "name": g.row.name,
+                    "domain": g.row.domain,
+                    "belief_strength": g.row.belief_strength,
+                    "coherence": g.row.coherence,
+                    "alive": g.row.alive,
+                    "birth_day": g.row.birth_day,
+                }
+                for g in self.engine.get_living_gods()
+            ],
+        }
+
+    def _build_belief_matrix(self) -> np.ndarray:
+        """
+        Copy the engine's beliefs as a read-only (citizens, domains) float32
+        matrix, columns in DOMAINS order (lock held).
+        """
+        beliefs = self.engine.get_citizen_table().beliefs.copy()
+        beliefs.flags.writeable = False
+        return beliefs
+
+    def cached_for_day(self, key: str, build: Callable[[], Any]) -> Any:
+        """
+        Get a value that only changes between ticks, building it at most once per day.
+
+        build() runs under the simulation lock and must not take it itself.
+        """
         with self._lock:
-            if not self.engine:
-                return None
+            return self._day_cached(key, build)
 
-            return {
-                "day": self.engine.current_day,
-                "age": self.engine.age_manager.current_age.value,
-                "age_day": self.engine.age_manager.day_counter,
-                "seed": self.engine.seed,
-                "citizens": [
-                    {
-                        "id": c.row.id,
-                        "name": c.row.name,
-                        "faction_id": c.row.faction_id,
-                        "beliefs": c.row.belief_vector,
-                        "fear": c.row.fear,
-                        "gratitude": c.row.gratitude,
-                        "alive": c.row.alive,
-                    }
-                    for c in self.engine.get_citizens()
-                ],
-                "factions": [
-                    {
-                        "id": f.row.id,
-                        "name": f.row.name,
-                        "doctrine": f.row.doctrine_bias,
-                    }
-                    for f in self.engine.get_factions()
-                ],
-                "gods": [
-                    {
-                        "id": g.id,
-                        "name": g.name,
-                        "domain": g.domain,
-                        "belief_strength": g.belief_strength,
-                        "coherence": g.coherence,
-                        "alive": g.alive,
-                        "birth_day": g.birth_day,
-                    }
-                    for g in self.db.get_all_gods(alive_only=True)
-                ],
-            }
+    def _day_cached(self, key: str, build: Callable[[], Any]) -> Any:
+        """cached_for_day() body; caller must hold the lock."""
+        day = self.engine.current_day if self.engine else 0
+        cached = self._day_cache.get(key)
+        if cached is not None and cached[0] == day:
+            return cached[1]
+        value = build()
+        self._day_cache[key] = (day, value)
+        return value
 
     def get_historical_scars(self) -> dict[tuple[int, int], dict[str, Any]]:
         """Get historical scar positions for LED display."""
         return self._historical_scars.copy()
 
+    def grid_cache_key(self) -> Optional[tuple[int, str, int]]:
+        """Identify the current grid: (day, age, scar version)."""
+        with self._lock:
+            if not self.engine:
+                return None
+            return (
+                self.engine.current_day,
+                self.engine.age_manager.current_age.value,
+                self._scar_version,
+            )
+
+    def get_grid_inputs(self) -> Optional[tuple[tuple[int, str, int], np.ndarray, Age, np.ndarray]]:
+        """
+        Get everything /grid is built from, read under one lock.
+
+        Returns (cache key, belief matrix, age, scar mask), all from the
+        same day, or None before initialization. The belief matrix is
+        read-only and built at most once per day.
+        """
+        with self._lock:
+            if not self.engine:
+                return None
+            age = self.engine.age_manager.current_age
+            key = (self.engine.current_day, age.value, self._scar_version)
+            beliefs = self._day_cached("grid/beliefs", self._build_belief_matrix)
+            return key, beliefs, age, self._scar_mask.copy()
+
+    def get_cached_grid(self, key: Optional[tuple[int, str, int]]) -> Optional[bytes]:
+        """Get the cached /grid payload if it was built for this key."""
+        cached = self._grid_cache
+        if key is not None and cached is not None and cached[0] == key:
+            return cached[1]
+        return None
+
+    def cache_grid(self, key: Optional[tuple[int, str, int]], payload: bytes) -> None:
+        """Remember the serialized /grid payload for this key."""
+        if key is None:
+            return
+        with self._lock:
+            self._grid_cache = (key, payload)
+
     @property
     def current_day(self) -> int:
         """Get current simulation day."""
-        with self._lock:
-            return self.engine.current_day if self.engine else 0
+        snapshot = self._snapshot
+        return snapshot["day"] if snapshot else 0
+
+    @property
+    def current_age(self) -> Optional[Age]:
+        """Get current simulation age."""
+        snapshot = self._snapshot
+        return Age(snapshot["age"]) if snapshot else None
 
     @property
     def is_running(self) -> bool:
@@ -190,5 +311,9 @@ class SimulationManager:
     def shutdown(self) -> None:
         """Clean shutdown."""
         self.stop()
-        if self.engine:
-            self.engine.shutdown()
+        # Cancelling the tick task does not stop an _advance already running
+        # in a worker thread; the lock waits for it to finish its tick
+        with self._lock:
+            if self.engine:
+                self.engine.shutdown()
+                self.engine = None
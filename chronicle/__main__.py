@@ -1,15 +1,39 @@
 """CLI entry point for Living Chronicle."""
 
+from __future__ import annotations
+
 import argparse
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+# The sim/data stack is imported inside the commands that use it so that
+# --help and argument errors stay fast
+if TYPE_CHECKING:
+    from .sim import SimulationEngine
+
+
+COMMANDS = ("run", "status")
+
+BANNER = (
+    "╔══════════════════════════════════════════════════════════╗\n"
+    "║           LIVING CHRONICLE                               ║\n"
+    "║     A Mythic Cyclical Civilization Simulator             ║\n"
+    "╚══════════════════════════════════════════════════════════╝\n"
+)
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Write a block of output lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
-from .data import Database
-from .sim import SimulationEngine, Narrator, VerboseNarrator
 
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Create the argument parser.
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser."""
+    If command is given, only that subcommand is registered; otherwise all
+    of them are (for help and usage errors).
+    """
     parser = argparse.ArgumentParser(
         prog="chronicle",
         description="Living Chronicle - A mythic cyclical civilization simulator",
@@ -17,7 +41,16 @@ def create_parser() -> argparse.ArgumentParser:
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Run command
+    if command in (None, "run"):
+        _add_run_parser(subparsers)
+    if command in (None, "status"):
+        _add_status_parser(subparsers)
+
+    return parser
+
+
+def _add_run_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the run command."""
     run_parser = subparsers.add_parser("run", help="Run the simulation")
     run_parser.add_argument(
         "--days", "-d",
@@ -53,7 +86,9 @@ def create_parser() -> argparse.ArgumentParser:
         help="Suppress narrative output",
     )
 
-    # Status command
+
+def _add_status_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the status command."""
     status_parser = subparsers.add_parser("status", help="Show simulation status")
     status_parser.add_argument(
         "--db",
@@ -62,13 +97,22 @@ def create_parser() -> argparse.ArgumentParser:
         help="Database file path (default: chronicle.db)",
     )
 
-    return parser
+
+def _sniff_subcommand(argv: list[str]) -> Optional[str]:
+    """Find the subcommand in argv without parsing, or None."""
+    for arg in argv[1:]:
+        if arg in COMMANDS:
+            return arg
+    return None
 
 
 def cmd_run(args: argparse.Namespace) -> int:
     """Run the simulation."""
     import random
 
+    from .data import Database
+    from .sim import SimulationEngine, Narrator, VerboseNarrator
+
     db = Database(args.db)
     rng = random.Random(args.seed)
 
@@ -80,107 +124,117 @@ def cmd_run(args: argparse.Namespace) -> int:
     engine = SimulationEngine(db, seed=args.seed, narrator=narrator.print_tick)
 
     try:
-        print("╔══════════════════════════════════════════════════════════╗")
-        print("║           LIVING CHRONICLE                               ║")
-        print("║     A Mythic Cyclical Civilization Simulator             ║")
-        print("╚══════════════════════════════════════════════════════════╝")
+        sys.stdout.write(BANNER)
+        sys.stdout.flush()
 
         engine.initialize(fresh=args.fresh)
 
+        lines: list[str] = []
         if args.fresh:
-            print(f"\nA new world awakens. Seed: {args.seed}")
+            lines.append(f"\nA new world awakens. Seed: {args.seed}")
             factions = engine.get_factions()
-            print(f"  {len(factions)} factions emerge from the primordial chaos:")
+            lines.append(f"  {len(factions)} factions emerge from the primordial chaos:")
             for faction in factions:
-                print(f"    • {faction.row.name}")
-            print(f"  {len(engine.get_citizens())} souls walk the land.")
+                lines.append(f"    • {faction.row.name}")
+            lines.append(f"  {len(engine.get_citizens())} souls walk the land.")
         else:
-            print(f"\nThe chronicle continues from day {engine.current_day}...")
+            lines.append(f"\nThe chronicle continues from day {engine.current_day}...")
 
-        print("\n" + "─" * 60)
+        lines.append("\n" + "─" * 60)
 
         if args.days:
-            print(f"Simulating {args.days} days...")
+            lines.append(f"Simulating {args.days} days...")
         else:
-            print("Simulating indefinitely (Ctrl+C to stop)...")
+            lines.append("Simulating indefinitely (Ctrl+C to stop)...")
+
+        _write_lines(lines)
+        sys.stdout.flush()
 
         engine.run(days=args.days)
 
         if args.days:
-            print("\n" + "─" * 60)
-            print(f"Simulation complete. {args.days} days have passed.")
-            _print_summary(engine)
+            _write_lines([
+                "\n" + "─" * 60,
+                f"Simulation complete. {args.days} days have passed.",
+                *_summary_lines(engine),
+            ])
 
     except KeyboardInterrupt:
-        print("\n\nThe chronicle pauses...")
-        _print_summary(engine)
+        _write_lines(["\n\nThe chronicle pauses...", *_summary_lines(engine)])
     finally:
         engine.shutdown()
 
     return 0
 
 
-def _print_summary(engine: SimulationEngine) -> None:
-    """Print a summary of the simulation state."""
-    print("\n═══ CHRONICLE SUMMARY ═══")
-    print(f"Day: {engine.current_day}")
-    print(f"Age: {engine.age_manager.current_age.value}")
+def _summary_lines(engine: SimulationEngine) -> list[str]:
+    """Build the summary of the simulation state as output lines."""
+    lines = [
+        "\n═══ CHRONICLE SUMMARY ═══",
+        f"Day: {engine.current_day}",
+        f"Age: {engine.age_manager.current_age.value}",
+    ]
+
+    gods, dead_gods = engine.db.get_gods_partitioned()
 
-    gods = engine.db.get_all_gods(alive_only=True)
     if gods:
-        print(f"\nLiving Gods ({len(gods)}):")
+        lines.append(f"\nLiving Gods ({len(gods)}):")
         for god in gods:
-            print(f"  • {god.name}, God of {god.domain.title()}")
-            print(f"    (Belief: {god.belief_strength:.2f}, Born day {god.birth_day})")
+            lines.append(f"  • {god.name}, God of {god.domain.title()}")
+            lines.append(f"    (Belief: {god.belief_strength:.2f}, Born day {god.birth_day})")
     else:
-        print("\nNo gods walk among mortals.")
+        lines.append("\nNo gods walk among mortals.")
 
-    dead_gods = engine.db.get_all_gods(alive_only=False)
-    dead_gods = [g for g in dead_gods if not g.alive]
     if dead_gods:
-        print(f"\nFallen Gods ({len(dead_gods)}):")
+        lines.append(f"\nFallen Gods ({len(dead_gods)}):")
         for god in dead_gods:
-            print(f"  • {god.name}, once of {god.domain.title()} (days {god.birth_day}-{god.death_day})")
+            lines.append(f"  • {god.name}, once of {god.domain.title()} (days {god.birth_day}-{god.death_day})")
+
+    return lines
 
 
 def cmd_status(args: argparse.Namespace) -> int:
     """Show simulation status."""
+    from pathlib import Path
+
+    from .data import Database
+
     db_path = Path(args.db)
     if not db_path.exists():
         print(f"No chronicle found at {args.db}")
         return 1
 
-    db = Database(args.db)
-    db.connect()
-
-    state = db.get_world_state()
-    if state is None:
-        print("Chronicle exists but contains no world state.")
-        db.close()
-        return 1
-
-    print("═══ CHRONICLE STATUS ═══")
-    print(f"Day: {state.current_day}")
-    print(f"Age: {state.current_age}")
-    print(f"Seed: {state.seed}")
-
-    citizens = db.get_all_citizens()
-    factions = db.get_all_factions()
-    gods = db.get_all_gods()
-    myths = db.get_all_myths()
-
-    print(f"\nPopulation: {len(citizens)} citizens")
-    print(f"Factions: {len(factions)}")
-    print(f"Gods (living/total): {len([g for g in gods if g.alive])}/{len(gods)}")
-    print(f"Myths recorded: {len(myths)}")
+    with Database(args.db) as db:
+        state = db.get_world_state()
+        if state is None:
+            print("Chronicle exists but contains no world state.")
+            return 1
+
+        citizens = db.get_all_citizens()
+        factions = db.get_all_factions()
+        gods = db.get_all_gods()
+        myths = db.get_all_myths()
+
+    living_gods = sum(1 for g in gods if g.alive)
+
+    _write_lines([
+        "═══ CHRONICLE STATUS ═══",
+        f"Day: {state.current_day}",
+        f"Age: {state.current_age}",
+        f"Seed: {state.seed}",
+        f"\nPopulation: {len(citizens)} citizens",
+        f"Factions: {len(factions)}",
+        f"Gods (living/total): {living_gods}/{len(gods)}",
+        f"Myths recorded: {len(myths)}",
+    ])
 
-    db.close()
     return 0
 
 
 def main() -> int:
     """Main entry point."""
-    parser = create_parser()
+    # Build only the invoked subcommand's parser when it can be spotted
+    parser = create_parser(_sniff_subcommand(sys.argv))
     args = parser.parse_args()
 
     if args.command is None:
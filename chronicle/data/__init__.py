@@ -1,13 +1,34 @@
 """Data persistence layer for Living Chronicle."""
 
-from .database import Database
-from .models import CitizenRow, FactionRow, MythRow, GodRow, WorldStateRow
-
-__all__ = [
-    "Database",
-    "CitizenRow",
-    "FactionRow",
-    "MythRow",
-    "GodRow",
-    "WorldStateRow",
-]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .database import Database
+    from .models import CitizenRow, FactionRow, MythRow, GodRow, WorldStateRow
+
+# Public name -> submodule; loaded on first access (PEP 562)
+_LAZY = {
+    "Database": ".database",
+    "CitizenRow": ".models",
+    "FactionRow": ".models",
+    "MythRow": ".models",
+    "GodRow": ".models",
+    "WorldStateRow": ".models",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,81 @@
 """SQLite database interface for Living Chronicle."""
 
+import contextlib
+import dataclasses
+import itertools
 import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Sequence, Union
 
-from .models import CitizenRow, FactionRow, MythRow, GodRow, WorldStateRow
+from .models import (
+    CitizenRow,
+    FactionRow,
+    MythRow,
+    GodRow,
+    WorldStateRow,
+    pack_domain_vector,
+    unpack_domain_vector,
+)
+
+# Any row type that saves through _save_rows
+_Row = Union[FactionRow, CitizenRow, MythRow, GodRow]
+
+# Explicit column lists, in the order each Row.from_db_row expects, so reads
+# do not depend on the table's physical column order
+_WORLD_STATE_COLUMNS = "id, current_day, current_age, age_day_counter, seed, rng_state"
+_FACTION_COLUMNS = "id, name, doctrine_bias"
+_CITIZEN_COLUMNS = "id, name, faction_id, belief_vector, fear, gratitude, alive"
+_MYTH_COLUMNS = "id, text, faction_id, domain, confidence, day_created"
+_GOD_COLUMNS = (
+    "id, name, domain, belief_strength, coherence, alive, birth_day, "
+    "death_day, consecutive_strong_days, consecutive_weak_days"
+)
+
+# Write statements are shared module constants so every call (and every
+# executemany) reuses the same prepared statement from the connection cache
+_SQL_SAVE_WORLD_STATE = """
+    INSERT OR REPLACE INTO world_state
+    (id, current_day, current_age, age_day_counter, seed, rng_state)
+    VALUES (1, ?, ?, ?, ?, ?)
+"""
+_SQL_ADVANCE_WORLD_STATE = """
+    UPDATE world_state SET current_day=?, age_day_counter=?, rng_state=?
+    WHERE id=1
+"""
+_SQL_INSERT_FACTION = "INSERT INTO factions (name, doctrine_bias) VALUES (?, ?)"
+_SQL_UPDATE_FACTION = "UPDATE factions SET name=?, doctrine_bias=? WHERE id=?"
+_SQL_INSERT_CITIZEN = """
+    INSERT INTO citizens
+    (name, faction_id, belief_vector, fear, gratitude, alive)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_CITIZEN = """
+    UPDATE citizens SET
+    name=?, faction_id=?, belief_vector=?, fear=?, gratitude=?, alive=?
+    WHERE id=?
+"""
+_SQL_UPDATE_CITIZEN_STATE = """
+    UPDATE citizens SET belief_vector=?, fear=?, gratitude=?, alive=?
+    WHERE id=?
+"""
+_SQL_INSERT_MYTH = """
+    INSERT INTO myths
+    (text, faction_id, domain, confidence, day_created)
+    VALUES (?, ?, ?, ?, ?)
+"""
+_SQL_INSERT_GOD = """
+    INSERT INTO gods
+    (name, domain, belief_strength, coherence, alive, birth_day,
+     death_day, consecutive_strong_days, consecutive_weak_days)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE_GOD = """
+    UPDATE gods SET
+    name=?, domain=?, belief_strength=?, coherence=?, alive=?,
+    birth_day=?, death_day=?, consecutive_strong_days=?,
+    consecutive_weak_days=?
+    WHERE id=?
+"""
 
 
 class Database:
@@ -13,11 +84,68 @@ class Database:
     def __init__(self, db_path: str = "chronicle.db"):
         self.db_path = Path(db_path)
         self.conn: Optional[sqlite3.Connection] = None
+        # Copy of the world_state row as last read or written
+        self._last_world_state: Optional[WorldStateRow] = None
+        # Nesting depth of transaction() blocks; save_* commit only at 0
+        self._transaction_depth = 0
 
     def connect(self) -> None:
         """Connect to the database and create tables if needed."""
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        self._configure()
         self._create_tables()
+        self._migrate_domain_vectors()
+
+    def _configure(self) -> None:
+        """
+        Tune the connection for a single-writer simulation.
+
+        WAL makes a commit one append to the log instead of rewriting the
+        rollback journal, and synchronous=NORMAL only syncs at checkpoints.
+        A crash can lose the last few ticks but never corrupts the file.
+        """
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-8192")  # 8 MiB
+        # Read pages straight from the OS page cache on warm re-runs
+        self.conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+
+    def flush(self) -> None:
+        """Commit any pending writes."""
+        self.conn.commit()
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Group writes into a single commit.
+
+        save_* calls inside the block skip their own commit; the outermost
+        block commits once on exit, or rolls everything back if it raises.
+        Blocks may nest.
+        """
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.conn.rollback()
+                # The cached row may describe a write that was just undone
+                self._last_world_state = None
+            raise
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self.conn.commit()
+
+    def _commit(self) -> None:
+        """Commit now unless a transaction() block will commit later."""
+        if self._transaction_depth == 0:
+            self.conn.commit()
 
     def close(self) -> None:
         """Close the database connection."""
@@ -25,6 +153,13 @@ class Database:
             self.conn.close()
             self.conn = None
 
+    def __enter__(self) -> "Database":
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
         cursor = self.conn.cursor()
@@ -35,15 +170,20 @@ class Database:
                 current_day INTEGER NOT NULL,
                 current_age TEXT NOT NULL,
                 age_day_counter INTEGER NOT NULL,
-                seed INTEGER NOT NULL
+                seed INTEGER NOT NULL,
+                rng_state TEXT
             )
         """)
+        # Databases created before rng_state existed
+        world_columns = {row[1] for row in cursor.execute("PRAGMA table_info(world_state)")}
+        if "rng_state" not in world_columns:
+            cursor.execute("ALTER TABLE world_state ADD COLUMN rng_state TEXT")
 
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS factions (
                 id INTEGER PRIMARY KEY,
                 name TEXT NOT NULL UNIQUE,
-                doctrine_bias TEXT NOT NULL
+                doctrine_bias BLOB NOT NULL
             )
         """)
 
@@ -52,7 +192,7 @@ class Database:
                 id INTEGER PRIMARY KEY,
                 name TEXT NOT NULL,
                 faction_id INTEGER,
-                belief_vector TEXT NOT NULL,
+                belief_vector BLOB NOT NULL,
                 fear REAL NOT NULL,
                 gratitude REAL NOT NULL,
                 alive INTEGER NOT NULL DEFAULT 1,
@@ -87,95 +227,166 @@ class Database:
             )
         """)
 
+        # Indexes for the hot filtered reads: living citizens by faction,
+        # living gods (by domain) and myths newest-first
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_citizens_faction
+            ON citizens(faction_id) WHERE alive = 1
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_gods_alive_domain
+            ON gods(domain) WHERE alive = 1
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_myths_day
+            ON myths(day_created DESC)
+        """)
+
+        # Refresh planner statistics when they are missing or stale
+        cursor.execute("PRAGMA optimize")
+
         self.conn.commit()
 
+    def _migrate_domain_vectors(self) -> None:
+        """Re-encode any legacy JSON belief/doctrine vectors as float32 blobs."""
+        with self.transaction():
+            for table, column in (("citizens", "belief_vector"), ("factions", "doctrine_bias")):
+                rows = self.conn.execute(
+                    f"SELECT id, {column} FROM {table} WHERE typeof({column}) = 'text'"
+                ).fetchall()
+                if rows:
+                    self.conn.executemany(
+                        f"UPDATE {table} SET {column}=? WHERE id=?",
+                        [(pack_domain_vector(unpack_domain_vector(data)), row_id) for row_id, data in rows],
+                    )
+
+    def _insert_many(self, cursor: sqlite3.Cursor, sql: str, rows: list[tuple]) -> int:
+        """
+        Run an INSERT over many rows and return the ID given to the first.
+
+        One executemany with no concurrent writer assigns consecutive rowids,
+        so the i-th row's ID is first + i.
+        """
+        cursor.executemany(sql, rows)
+        last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return last_id - len(rows) + 1
+
+    def _insert_new_rows(self, cursor: sqlite3.Cursor, rows: Sequence[_Row], insert_sql: str) -> None:
+        """Insert the rows that have no ID yet and assign them their new IDs."""
+        new = [row for row in rows if row.id is None]
+        if new:
+            first_id = self._insert_many(
+                cursor,
+                insert_sql,
+                [row.to_db_tuple()[1:] for row in new]
+            )
+            for i, row in enumerate(new):
+                row.id = first_id + i
+
+    def _save_rows(self, rows: Sequence[_Row], insert_sql: str, update_sql: str) -> None:
+        """Insert new rows and update existing ones, then commit."""
+        # Collected before the insert, which gives new rows their IDs
+        updates = []
+        for row in rows:
+            if row.id is not None:
+                t = row.to_db_tuple()
+                updates.append((*t[1:], t[0]))
+        cursor = self.conn.cursor()
+        self._insert_new_rows(cursor, rows, insert_sql)
+        if updates:
+            cursor.executemany(update_sql, updates)
+        self._commit()
+
     # World State operations
     def get_world_state(self) -> Optional[WorldStateRow]:
         """Get the current world state."""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM world_state WHERE id = 1")
+        cursor.execute(f"SELECT {_WORLD_STATE_COLUMNS} FROM world_state WHERE id = 1")
         row = cursor.fetchone()
-        return WorldStateRow.from_db_row(row) if row else None
+        state = WorldStateRow.from_db_row(row) if row else None
+        self._last_world_state = dataclasses.replace(state) if state else None
+        return state
 
     def save_world_state(self, state: WorldStateRow) -> None:
-        """Save or update the world state."""
+        """
+        Save or update the world state.
+
+        Within an age only the day counters move, so those ticks update the
+        two columns in place; the full row is rewritten when the age or seed
+        changes.
+        """
+        last = self._last_world_state
         cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO world_state
-            (id, current_day, current_age, age_day_counter, seed)
-            VALUES (1, ?, ?, ?, ?)
-        """, (state.current_day, state.current_age, state.age_day_counter, state.seed))
-        self.conn.commit()
+        if last is not None and last.current_age == state.current_age and last.seed == state.seed:
+            cursor.execute(_SQL_ADVANCE_WORLD_STATE, (state.current_day, state.age_day_counter, state.rng_state))
+        else:
+            cursor.execute(_SQL_SAVE_WORLD_STATE, state.to_db_tuple()[1:])
+        self._commit()
+        self._last_world_state = dataclasses.replace(state)
 
     # Faction operations
     def save_faction(self, faction: FactionRow) -> int:
         """Save a faction and return its ID."""
-        cursor = self.conn.cursor()
-        if faction.id is None:
-            cursor.execute(
-                "INSERT INTO factions (name, doctrine_bias) VALUES (?, ?)",
-                (faction.name, faction.to_db_tuple()[2])
-            )
-            faction.id = cursor.lastrowid
-        else:
-            cursor.execute(
-                "UPDATE factions SET name=?, doctrine_bias=? WHERE id=?",
-                (faction.name, faction.to_db_tuple()[2], faction.id)
-            )
-        self.conn.commit()
+        self.save_factions([faction])
         return faction.id
 
+    def save_factions(self, factions: list[FactionRow]) -> None:
+        """Save many factions in one transaction, assigning IDs to new ones."""
+        self._save_rows(factions, _SQL_INSERT_FACTION, _SQL_UPDATE_FACTION)
+
     def get_all_factions(self) -> list[FactionRow]:
         """Get all factions."""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM factions")
+        cursor.execute(f"SELECT {_FACTION_COLUMNS} FROM factions")
         return [FactionRow.from_db_row(row) for row in cursor.fetchall()]
 
     def get_faction(self, faction_id: int) -> Optional[FactionRow]:
         """Get a faction by ID."""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM factions WHERE id = ?", (faction_id,))
+        cursor.execute(f"SELECT {_FACTION_COLUMNS} FROM factions WHERE id = ?", (faction_id,))
         row = cursor.fetchone()
         return FactionRow.from_db_row(row) if row else None
 
     # Citizen operations
     def save_citizen(self, citizen: CitizenRow) -> int:
         """Save a citizen and return their ID."""
-        cursor = self.conn.cursor()
-        if citizen.id is None:
-            t = citizen.to_db_tuple()
-            cursor.execute(
-                """INSERT INTO citizens
-                   (name, faction_id, belief_vector, fear, gratitude, alive)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                t[1:]
-            )
-            citizen.id = cursor.lastrowid
-        else:
-            t = citizen.to_db_tuple()
-            cursor.execute(
-                """UPDATE citizens SET
-                   name=?, faction_id=?, belief_vector=?, fear=?, gratitude=?, alive=?
-                   WHERE id=?""",
-                (*t[1:], t[0])
-            )
-        self.conn.commit()
+        self.save_citizens([citizen])
         return citizen.id
 
+    def save_citizens(self, citizens: list[CitizenRow]) -> None:
+        """Save many citizens in one transaction, assigning IDs to new ones."""
+        self._save_rows(citizens, _SQL_INSERT_CITIZEN, _SQL_UPDATE_CITIZEN)
+
+    def save_citizen_states(self, citizens: list[CitizenRow]) -> None:
+        """
+        Write the per-tick state of already-saved citizens.
+
+        Only beliefs, emotions and alive change during a run, so this skips
+        re-binding names and factions.
+        """
+        self.conn.executemany(
+            _SQL_UPDATE_CITIZEN_STATE,
+            [
+                (pack_domain_vector(c.belief_vector), c.fear, c.gratitude, c.alive, c.id)
+                for c in citizens
+            ],
+        )
+        self._commit()
+
     def get_all_citizens(self, alive_only: bool = True) -> list[CitizenRow]:
         """Get all citizens."""
         cursor = self.conn.cursor()
         if alive_only:
-            cursor.execute("SELECT * FROM citizens WHERE alive = 1")
+            cursor.execute(f"SELECT {_CITIZEN_COLUMNS} FROM citizens WHERE alive = 1 ORDER BY id")
         else:
-            cursor.execute("SELECT * FROM citizens")
+            cursor.execute(f"SELECT {_CITIZEN_COLUMNS} FROM citizens ORDER BY id")
         return [CitizenRow.from_db_row(row) for row in cursor.fetchall()]
 
     def get_citizens_by_faction(self, faction_id: int) -> list[CitizenRow]:
         """Get all citizens in a faction."""
         cursor = self.conn.cursor()
         cursor.execute(
-            "SELECT * FROM citizens WHERE faction_id = ? AND alive = 1",
+            f"SELECT {_CITIZEN_COLUMNS} FROM citizens WHERE faction_id = ? AND alive = 1",
             (faction_id,)
         )
         return [CitizenRow.from_db_row(row) for row in cursor.fetchall()]
@@ -183,80 +394,70 @@ class Database:
     # Myth operations
     def save_myth(self, myth: MythRow) -> int:
         """Save a myth and return its ID."""
-        cursor = self.conn.cursor()
-        if myth.id is None:
-            t = myth.to_db_tuple()
-            cursor.execute(
-                """INSERT INTO myths
-                   (text, faction_id, domain, confidence, day_created)
-                   VALUES (?, ?, ?, ?, ?)""",
-                t[1:]
-            )
-            myth.id = cursor.lastrowid
-        self.conn.commit()
+        self.save_myths([myth])
         return myth.id
 
+    def save_myths(self, myths: list[MythRow]) -> None:
+        """Insert many new myths in one transaction (myths are never updated)."""
+        self._insert_new_rows(self.conn.cursor(), myths, _SQL_INSERT_MYTH)
+        self._commit()
+
     def get_all_myths(self) -> list[MythRow]:
         """Get all myths."""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM myths ORDER BY day_created DESC")
+        cursor.execute(f"SELECT {_MYTH_COLUMNS} FROM myths ORDER BY day_created DESC")
         return [MythRow.from_db_row(row) for row in cursor.fetchall()]
 
     # God operations
     def save_god(self, god: GodRow) -> int:
         """Save a god and return their ID."""
-        cursor = self.conn.cursor()
-        if god.id is None:
-            t = god.to_db_tuple()
-            cursor.execute(
-                """INSERT INTO gods
-                   (name, domain, belief_strength, coherence, alive, birth_day,
-                    death_day, consecutive_strong_days, consecutive_weak_days)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                t[1:]
-            )
-            god.id = cursor.lastrowid
-        else:
-            t = god.to_db_tuple()
-            cursor.execute(
-                """UPDATE gods SET
-                   name=?, domain=?, belief_strength=?, coherence=?, alive=?,
-                   birth_day=?, death_day=?, consecutive_strong_days=?,
-                   consecutive_weak_days=?
-                   WHERE id=?""",
-                (*t[1:], t[0])
-            )
-        self.conn.commit()
+        self.save_gods([god])
         return god.id
 
+    def save_gods(self, gods: list[GodRow]) -> None:
+        """Save many gods in one transaction, assigning IDs to new ones."""
+        self._save_rows(gods, _SQL_INSERT_GOD, _SQL_UPDATE_GOD)
+
     def get_all_gods(self, alive_only: bool = False) -> list[GodRow]:
         """Get all gods."""
         cursor = self.conn.cursor()
         if alive_only:
-            cursor.execute("SELECT * FROM gods WHERE alive = 1")
+            cursor.execute(f"SELECT {_GOD_COLUMNS} FROM gods WHERE alive = 1 ORDER BY id")
         else:
-            cursor.execute("SELECT * FROM gods")
+            cursor.execute(f"SELECT {_GOD_COLUMNS} FROM gods ORDER BY id")
         return [GodRow.from_db_row(row) for row in cursor.fetchall()]
 
+    def get_gods_partitioned(self) -> tuple[list[GodRow], list[GodRow]]:
+        """Get (living, fallen) gods, each in order of birth, from one query."""
+        cursor = self.conn.cursor()
+        cursor.execute(f"SELECT {_GOD_COLUMNS} FROM gods ORDER BY alive DESC, birth_day, id")
+        living: list[GodRow] = []
+        fallen: list[GodRow] = []
+        gods = (GodRow.from_db_row(row) for row in cursor.fetchall())
+        for alive, group in itertools.groupby(gods, key=lambda g: g.alive):
+            (living if alive else fallen).extend(group)
+        return living, fallen
+
     def get_god_by_domain(self, domain: str, alive_only: bool = True) -> Optional[GodRow]:
         """Get a god by domain."""
         cursor = self.conn.cursor()
         if alive_only:
             cursor.execute(
-                "SELECT * FROM gods WHERE domain = ? AND alive = 1",
+                f"SELECT {_GOD_COLUMNS} FROM gods WHERE domain = ? AND alive = 1",
                 (domain,)
             )
         else:
-            cursor.execute("SELECT * FROM gods WHERE domain = ?", (domain,))
+            cursor.execute(f"SELECT {_GOD_COLUMNS} FROM gods WHERE domain = ?", (domain,))
         row = cursor.fetchone()
         return GodRow.from_db_row(row) if row else None
 
     def clear_all(self) -> None:
         """Clear all data (for fresh starts)."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM myths")
-        cursor.execute("DELETE FROM citizens")
-        cursor.execute("DELETE FROM gods")
-        cursor.execute("DELETE FROM factions")
-        cursor.execute("DELETE FROM world_state")
-        self.conn.commit()
+        with self.transaction():
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM myths")
+            cursor.execute("DELETE FROM citizens")
+            cursor.execute("DELETE FROM gods")
+            cursor.execute("DELETE FROM factions")
+            cursor.execute("DELETE FROM world_state")
+        self._last_world_state = None
@@ -1,21 +1,88 @@
 """Data models for SQLite persistence."""
 
+from collections.abc import Iterator, MutableMapping
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Union
 import json
+import struct
+
+import numpy as np
 
 
 # Domain constants
 DOMAINS = ["river", "flame", "sky", "war", "harvest", "memory"]
+DOMAIN_INDEX = {domain: i for i, domain in enumerate(DOMAINS)}
+
+# Per-domain float vectors are stored as packed little-endian float32 in
+# DOMAINS order
+_DOMAIN_VECTOR = struct.Struct(f"<{len(DOMAINS)}f")
+
+
+class BeliefVector(MutableMapping):
+    """
+    Dict-like domain -> belief view onto one row of a belief matrix.
+
+    Reads and writes go straight to the underlying float32 array, so code
+    that treats a belief vector as a dict and code that updates the whole
+    matrix with NumPy see the same values. The domain keys are fixed.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: np.ndarray):
+        self.values = values  # float32, shape (len(DOMAINS),)
+
+    def __getitem__(self, domain: str) -> float:
+        return float(self.values[DOMAIN_INDEX[domain]])
+
+    def __setitem__(self, domain: str, value: float) -> None:
+        self.values[DOMAIN_INDEX[domain]] = value
+
+    def __delitem__(self, domain: str) -> None:
+        raise TypeError("belief vector domains are fixed")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(DOMAINS)
+
+    def __len__(self) -> int:
+        return len(DOMAINS)
+
+    def get(self, domain: str, default: Optional[float] = None) -> Optional[float]:
+        index = DOMAIN_INDEX.get(domain)
+        return default if index is None else float(self.values[index])
+
+    def __repr__(self) -> str:
+        return f"BeliefVector({dict(self)})"
+
+
+def pack_domain_vector(vector: MutableMapping) -> bytes:
+    """Encode a domain -> value mapping as a fixed-order float32 blob."""
+    if isinstance(vector, BeliefVector):
+        return vector.values.astype("<f4", copy=False).tobytes()
+    return _DOMAIN_VECTOR.pack(*(vector.get(d, 0.0) for d in DOMAINS))
+
+
+def unpack_domain_vector(data: Union[bytes, str]) -> dict[str, float]:
+    """Decode a domain vector blob (or a legacy JSON object) into a dict."""
+    if isinstance(data, str):
+        return json.loads(data)
+    return dict(zip(DOMAINS, _DOMAIN_VECTOR.unpack(data)))
+
+
+def unpack_belief_vector(data: Union[bytes, str]) -> MutableMapping[str, float]:
+    """Decode a citizen belief blob into a BeliefVector (legacy JSON stays a dict)."""
+    if isinstance(data, str):
+        return json.loads(data)
+    return BeliefVector(np.frombuffer(data, dtype="<f4").astype(np.float32))
 
 
-@dataclass
+@dataclass(slots=True)
 class CitizenRow:
     """Represents a citizen in the database."""
     id: Optional[int]
     name: str
     faction_id: Optional[int]
-    belief_vector: dict[str, float]  # domain -> strength
+    belief_vector: MutableMapping[str, float]  # domain -> strength (dict or BeliefVector)
     fear: float  # 0.0 to 1.0
     gratitude: float  # 0.0 to 1.0
     alive: bool = True
@@ -25,7 +92,7 @@ class CitizenRow:
             self.id,
             self.name,
             self.faction_id,
-            json.dumps(self.belief_vector),
+            pack_domain_vector(self.belief_vector),
             self.fear,
             self.gratitude,
             self.alive,
@@ -37,14 +104,14 @@ class CitizenRow:
             id=row[0],
             name=row[1],
             faction_id=row[2],
-            belief_vector=json.loads(row[3]),
+            belief_vector=unpack_belief_vector(row[3]),
             fear=row[4],
             gratitude=row[5],
             alive=bool(row[6]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FactionRow:
     """Represents a faction in the database."""
     id: Optional[int]
@@ -52,18 +119,18 @@ class FactionRow:
     doctrine_bias: dict[str, float]  # domain -> weight
 
     def to_db_tuple(self) -> tuple:
-        return (self.id, self.name, json.dumps(self.doctrine_bias))
+        return (self.id, self.name, pack_domain_vector(self.doctrine_bias))
 
     @classmethod
     def from_db_row(cls, row: tuple) -> "FactionRow":
         return cls(
             id=row[0],
             name=row[1],
-            doctrine_bias=json.loads(row[2]),
+            doctrine_bias=unpack_domain_vector(row[2]),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MythRow:
     """Represents a myth (event interpretation) in the database."""
     id: Optional[int]
@@ -95,7 +162,7 @@ class MythRow:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GodRow:
     """Represents a god in the database."""
     id: Optional[int]
@@ -139,7 +206,7 @@ class GodRow:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorldStateRow:
     """Represents the world state in the database."""
     id: Optional[int]
@@ -147,6 +214,7 @@ class WorldStateRow:
     current_age: str
     age_day_counter: int  # days in current age
     seed: int
+    rng_state: Optional[str] = None  # JSON of the numpy bit generator state
 
     def to_db_tuple(self) -> tuple:
         return (
@@ -155,6 +223,7 @@ class WorldStateRow:
             self.current_age,
             self.age_day_counter,
             self.seed,
+            self.rng_state,
         )
 
     @classmethod
@@ -165,4 +234,5 @@ class WorldStateRow:
             current_age=row[2],
             age_day_counter=row[3],
             seed=row[4],
+            rng_state=row[5],
         )
@@ -1,24 +1,47 @@
 """Simulation logic for Living Chronicle."""
 
-from .engine import SimulationEngine, TickResult
-from .ages import Age, AgeManager
-from .entities import Citizen, Faction, Myth, God
-from .events import EventGenerator, Event
-from .gods import GodSystem
-from .narration import Narrator, VerboseNarrator
-
-__all__ = [
-    "SimulationEngine",
-    "TickResult",
-    "Age",
-    "AgeManager",
-    "Citizen",
-    "Faction",
-    "Myth",
-    "God",
-    "EventGenerator",
-    "Event",
-    "GodSystem",
-    "Narrator",
-    "VerboseNarrator",
-]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .engine import SimulationEngine, TickResult
+    from .ages import Age, AgeManager
+    from .entities import Citizen, CitizenTable, Faction, Myth, God
+    from .events import EventGenerator, Event
+    from .gods import GodSystem
+    from .narration import Narrator, VerboseNarrator
+
+# Public name -> submodule; loaded on first access (PEP 562) so that e.g.
+# importing Age does not pull in the engine, gods, events and narration
+_LAZY = {
+    "SimulationEngine": ".engine",
+    "TickResult": ".engine",
+    "Age": ".ages",
+    "AgeManager": ".ages",
+    "Citizen": ".entities",
+    "CitizenTable": ".entities",
+    "Faction": ".entities",
+    "Myth": ".entities",
+    "God": ".entities",
+    "EventGenerator": ".events",
+    "Event": ".events",
+    "GodSystem": ".gods",
+    "Narrator": ".narration",
+    "VerboseNarrator": ".narration",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,7 @@
 """Age cycle management for Living Chronicle."""
 
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 import random
 
@@ -15,11 +15,25 @@ class Age(Enum):
     SILENCE = "Silence"
     REBIRTH = "Rebirth"
 
+    # Position in the cycle, for tuple lookups keyed by age (set below)
+    ordinal: int
+
     def next(self) -> "Age":
         """Get the next age in the cycle."""
-        cycle = list(Age)
-        idx = cycle.index(self)
-        return cycle[(idx + 1) % len(cycle)]
+        return _NEXT_AGE[self]
+
+
+# The cycle in order, frozen once so nothing re-walks the enum
+_AGE_CYCLE: tuple[Age, ...] = tuple(Age)
+for _i, _age in enumerate(_AGE_CYCLE):
+    _age.ordinal = _i
+del _i, _age
+
+# Age -> following age
+_NEXT_AGE = {
+    age: _AGE_CYCLE[(age.ordinal + 1) % len(_AGE_CYCLE)]
+    for age in _AGE_CYCLE
+}
 
 
 # Age characteristics
@@ -82,6 +96,24 @@ class AgeManager:
     day_counter: int  # days in current age
     age_duration: int  # total days this age will last
     rng: random.Random
+    # AGE_TRAITS entry for current_age and its per-tick modifiers as plain
+    # attributes, refreshed on every transition
+    traits: dict = field(init=False, repr=False, compare=False)
+    event_rate: float = field(init=False, repr=False, compare=False)
+    belief_growth: float = field(init=False, repr=False, compare=False)
+    fear_modifier: float = field(init=False, repr=False, compare=False)
+    gratitude_modifier: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._load_traits()
+
+    def _load_traits(self) -> None:
+        """Cache the current age's traits on the manager."""
+        self.traits = traits = AGE_TRAITS[self.current_age]
+        self.event_rate = traits["event_rate"]
+        self.belief_growth = traits["belief_growth"]
+        self.fear_modifier = traits["fear_modifier"]
+        self.gratitude_modifier = traits["gratitude_modifier"]
 
     @classmethod
     def new(cls, rng: random.Random) -> "AgeManager":
@@ -124,11 +156,6 @@ class AgeManager:
         """Transition to the next age."""
         self.current_age = self.current_age.next()
         self.day_counter = 0
-        traits = AGE_TRAITS[self.current_age]
-        self.age_duration = self.rng.randint(traits["min_days"], traits["max_days"])
+        self._load_traits()
+        self.age_duration = self.rng.randint(self.traits["min_days"], self.traits["max_days"])
         return self.current_age
-
-    @property
-    def traits(self) -> dict:
-        """Get current age traits."""
-        return AGE_TRAITS[self.current_age]
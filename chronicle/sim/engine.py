@@ -2,12 +2,23 @@
 
 from dataclasses import dataclass, field
 from typing import Optional, Callable
+import json
 import random
 
+import numpy as np
+
 from ..data.database import Database
-from ..data.models import WorldStateRow, DOMAINS
+from ..data.models import WorldStateRow, DOMAINS, DOMAIN_INDEX
 from .ages import Age, AgeManager
-from .entities import Citizen, Faction, Myth, God
+from .entities import (
+    Citizen,
+    CitizenTable,
+    Faction,
+    Myth,
+    God,
+    generate_citizen_names,
+    generate_faction_names,
+)
 from .events import Event, EventGenerator
 from .gods import GodSystem
 
@@ -42,6 +53,9 @@ class SimulationEngine:
         self.db = db
         self.seed = seed
         self.rng = random.Random(seed)
+        # Vectorized draws (one call per tick for the whole population);
+        # single rolls and name/choice helpers stay on self.rng
+        self.np_rng = np.random.default_rng(seed)
         self.narrator = narrator
 
         self.age_manager: Optional[AgeManager] = None
@@ -50,7 +64,18 @@ class SimulationEngine:
         self.current_day = 0
 
         self._factions: list[Faction] = []
+        self._faction_by_id: dict[int, Faction] = {}
         self._citizens: list[Citizen] = []
+        self._citizen_table = CitizenTable([])
+        # Doctrine bias per (faction index, domain); row 0 is all 1.0 for
+        # unaffiliated citizens, row i + 1 is self._factions[i]
+        self._faction_bias = np.ones((1, len(DOMAINS)))
+        # Row of _faction_bias for each citizen, in _citizens order
+        self._faction_index = np.zeros(0, dtype=np.int32)
+        # Per-tick scratch for _apply_event, one row per citizen: jitter and
+        # the belief/fear/gratitude deltas built from it
+        self._jitter = np.empty((0, 3), dtype=np.float32)
+        self._deltas = np.empty((0, 3), dtype=np.float64)
 
     def initialize(self, fresh: bool = False) -> None:
         """Initialize or restore the simulation."""
@@ -66,42 +91,74 @@ class SimulationEngine:
         else:
             self._restore_world(world_state)
 
-        self.event_generator = EventGenerator(self.rng)
+        self.event_generator = EventGenerator(self.rng, self.np_rng)
         self.god_system = GodSystem(self.db, self.rng)
+        self._ensure_scratch()
+
+    def _ensure_scratch(self) -> None:
+        """Size the _apply_event scratch buffers to the population."""
+        n = len(self._citizen_table)
+        if len(self._jitter) != n:
+            self._jitter = np.empty((n, 3), dtype=np.float32)
+            self._deltas = np.empty((n, 3), dtype=np.float64)
 
     def _create_new_world(self) -> None:
         """Create a fresh new world."""
         self.current_day = 0
         self.age_manager = AgeManager.new(self.rng)
 
+        # Draw every name up front
+        faction_names = generate_faction_names(INITIAL_FACTIONS, self.np_rng)
+        citizen_names = iter(generate_citizen_names(
+            INITIAL_FACTIONS * INITIAL_CITIZENS_PER_FACTION + UNAFFILIATED_CITIZENS,
+            self.np_rng,
+        ))
+
         # Create factions
-        for _ in range(INITIAL_FACTIONS):
-            faction = Faction.generate(self.rng)
-            self.db.save_faction(faction.row)
+        for faction_name in faction_names:
+            faction = Faction.generate(self.rng, name=faction_name)
             self._factions.append(faction)
 
-            # Create citizens for faction
+            # Create citizens for faction (faction_id is set once saved)
             for _ in range(INITIAL_CITIZENS_PER_FACTION):
-                citizen = Citizen.generate(faction.row.id, self.rng)
-                self.db.save_citizen(citizen.row)
+                citizen = Citizen.generate(None, self.rng, name=next(citizen_names))
                 faction.members.append(citizen)
                 self._citizens.append(citizen)
 
         # Create unaffiliated citizens
         for _ in range(UNAFFILIATED_CITIZENS):
-            citizen = Citizen.generate(None, self.rng)
-            self.db.save_citizen(citizen.row)
+            citizen = Citizen.generate(None, self.rng, name=next(citizen_names))
             self._citizens.append(citizen)
 
-        # Save initial world state
-        self._save_world_state()
+        self._citizen_table = CitizenTable(self._citizens)
+
+        # Save the new world in bulk; factions first so members get their IDs
+        with self.db.transaction():
+            self.db.save_factions([f.row for f in self._factions])
+            self._faction_by_id = {f.row.id: f for f in self._factions}
+            for faction in self._factions:
+                for citizen in faction.members:
+                    citizen.row.faction_id = faction.row.id
+            self.db.save_citizens([c.row for c in self._citizens])
+
+            # Save initial world state
+            self._save_world_state()
+
+        self._index_factions()
 
     def _restore_world(self, state: WorldStateRow) -> None:
         """Restore world from saved state."""
         self.current_day = state.current_day
         self.seed = state.seed
         self.rng = random.Random(state.seed)
-        # Advance RNG to current state
+        self.np_rng = np.random.default_rng(state.seed)
+        if state.rng_state:
+            # Resume the exact numpy stream (saves made before rng_state
+            # existed restart it from the seed)
+            self.np_rng.bit_generator.state = json.loads(state.rng_state)
+        # random.Random is not saved: this only approximates its position,
+        # and the age duration is re-estimated below, so a restored run is
+        # not guaranteed to match an uninterrupted one day for day
         for _ in range(state.current_day):
             self.rng.random()
 
@@ -115,16 +172,32 @@ class SimulationEngine:
         for faction_row in self.db.get_all_factions():
             faction = Faction(faction_row)
             self._factions.append(faction)
+            self._faction_by_id[faction_row.id] = faction
 
         for citizen_row in self.db.get_all_citizens():
             citizen = Citizen(citizen_row)
             self._citizens.append(citizen)
             # Associate with faction
-            if citizen.row.faction_id:
-                for faction in self._factions:
-                    if faction.row.id == citizen.row.faction_id:
-                        faction.members.append(citizen)
-                        break
+            faction = self._faction_by_id.get(citizen.row.faction_id)
+            if faction is not None:
+                faction.members.append(citizen)
+
+        self._citizen_table = CitizenTable(self._citizens)
+        self._index_factions()
+
+    def _index_factions(self) -> None:
+        """Build the faction bias matrix and each citizen's row in it."""
+        self._faction_bias = np.array(
+            [[1.0] * len(DOMAINS)]
+            + [[f.get_bias(domain) for domain in DOMAINS] for f in self._factions],
+            dtype=np.float64,
+        )
+        row_of = {f.row.id: i + 1 for i, f in enumerate(self._factions)}
+        self._faction_index = np.fromiter(
+            (row_of.get(c.row.faction_id, 0) for c in self._citizens),
+            dtype=np.int32,
+            count=len(self._citizens),
+        )
 
     def _save_world_state(self) -> None:
         """Save current world state."""
@@ -134,6 +207,7 @@ class SimulationEngine:
             current_age=self.age_manager.current_age.value,
             age_day_counter=self.age_manager.day_counter,
             seed=self.seed,
+            rng_state=json.dumps(self.np_rng.bit_generator.state),
         )
         self.db.save_world_state(state)
 
@@ -147,28 +221,32 @@ class SimulationEngine:
         # Generate event
         event = self.event_generator.generate_event(
             self.age_manager.current_age,
-            self.age_manager.traits["event_rate"]
-        )
-
-        new_myths = []
-        if event:
-            # Apply event effects to citizens
-            self._apply_event(event)
-            # Create myths from event
-            new_myths = self._create_myths(event)
-
-        # Process emergent gods
-        born_gods, faded_gods = self.god_system.process_gods(
-            self._citizens,
-            self.current_day
+            self.age_manager.event_rate
         )
 
-        # Save all citizen state
-        for citizen in self._citizens:
-            self.db.save_citizen(citizen.row)
-
-        # Save world state
-        self._save_world_state()
+        # All of the day's writes land in one commit
+        with self.db.transaction():
+            new_myths = []
+            if event:
+                # Apply event effects to citizens
+                self._apply_event(event)
+                # Create myths from event
+                new_myths = self._create_myths(event)
+
+            # Process emergent gods
+            born_gods, faded_gods = self.god_system.process_gods(
+                self._citizen_table.beliefs,
+                self.current_day
+            )
+
+            # Only _apply_event changes citizens (god processing just reads
+            # the belief matrix), so event-less days skip citizen writes;
+            # rows flagged with mark_dirty wait for the next event or shutdown
+            if event is not None:
+                self._save_dirty_citizens()
+
+            # Save world state
+            self._save_world_state()
 
         result = TickResult(
             day=self.current_day,
@@ -187,40 +265,50 @@ class SimulationEngine:
 
     def _apply_event(self, event: Event) -> None:
         """Apply event effects to citizens."""
-        age_traits = self.age_manager.traits
-        belief_growth = age_traits["belief_growth"]
-        fear_mod = age_traits["fear_modifier"]
-        grat_mod = age_traits["gratitude_modifier"]
-
-        for citizen in self._citizens:
-            # Get faction bias if applicable
-            faction_bias = 1.0
-            if citizen.row.faction_id:
-                for faction in self._factions:
-                    if faction.row.id == citizen.row.faction_id:
-                        faction_bias = faction.get_bias(event.primary_domain)
-                        break
-
-            # Update beliefs
-            belief_delta = event.belief_impact * belief_growth * (0.8 + self.rng.random() * 0.4)
-            citizen.update_belief(event.primary_domain, belief_delta, faction_bias)
-
-            if event.secondary_domain:
-                secondary_delta = belief_delta * 0.5
-                citizen.update_belief(event.secondary_domain, secondary_delta, faction_bias)
-
-            # Update emotions
-            fear_delta = event.fear_impact * fear_mod * (0.8 + self.rng.random() * 0.4)
-            grat_delta = event.gratitude_impact * grat_mod * (0.8 + self.rng.random() * 0.4)
-            citizen.update_emotion(fear_delta, grat_delta)
+        age_manager = self.age_manager
+        table = self._citizen_table
+
+        # Per-citizen jitter in [0.8, 1.2) for belief, fear and gratitude,
+        # drawn in one call and scaled in place
+        self._ensure_scratch()
+        jitter = self._jitter
+        self.np_rng.random(dtype=np.float32, out=jitter)
+        jitter *= 0.4
+        jitter += 0.8
+
+        # Scale each jitter column by its event impact and age modifier in
+        # one broadcast: columns are belief, fear and gratitude deltas
+        deltas = np.multiply(jitter, [
+            event.belief_impact * age_manager.belief_growth,
+            event.fear_impact * age_manager.fear_modifier,
+            event.gratitude_impact * age_manager.gratitude_modifier,
+        ], out=self._deltas)
+        belief_delta = deltas[:, 0]
+
+        # Faction bias toward the primary domain; unaffiliated citizens get 1.0
+        faction_bias = self._faction_bias[self._faction_index, DOMAIN_INDEX[event.primary_domain]]
+
+        # Update beliefs; the secondary domain (never the primary) moves at
+        # half strength in the same pass
+        if event.secondary_domain:
+            domains = [event.primary_domain, event.secondary_domain]
+            belief_deltas = belief_delta[:, np.newaxis] * [1.0, 0.5]
+        else:
+            domains = [event.primary_domain]
+            belief_deltas = belief_delta[:, np.newaxis]
+        table.update_beliefs(domains, belief_deltas * faction_bias[:, np.newaxis])
+
+        # Update emotions
+        table.update_emotions(deltas[:, 1], deltas[:, 2])
 
     def _create_myths(self, event: Event) -> list[Myth]:
         """Create myths from an event interpretation."""
         myths = []
 
-        # Each faction might create a myth
-        for faction in self._factions:
-            if self.rng.random() < 0.3:  # 30% chance per faction
+        # Each faction might create a myth (30% chance per faction)
+        rolls = self.np_rng.random(len(self._factions))
+        for faction, roll in zip(self._factions, rolls.tolist()):
+            if roll < 0.3:
                 confidence = faction.get_bias(event.primary_domain)
                 myth = Myth.create(
                     text=f"The {faction.row.name} witnessed {event.description}",
@@ -229,9 +317,9 @@ class SimulationEngine:
                     faction_id=faction.row.id,
                     day=self.current_day,
                 )
-                self.db.save_myth(myth.row)
                 myths.append(myth)
 
+        self.db.save_myths([m.row for m in myths])
         return myths
 
     def run(self, days: Optional[int] = None) -> None:
@@ -247,10 +335,26 @@ class SimulationEngine:
         """Get all citizens."""
         return self._citizens
 
+    def get_citizen_table(self) -> CitizenTable:
+        """Get the column storage backing all citizens."""
+        return self._citizen_table
+
     def get_factions(self) -> list[Faction]:
         """Get all factions."""
         return self._factions
 
+    def get_living_gods(self) -> list[God]:
+        """Get the gods currently alive, in birth order."""
+        return self.god_system.get_living_gods()
+
+    def _save_dirty_citizens(self) -> None:
+        """Write the citizens flagged dirty since the last save."""
+        changed = self._citizen_table.pop_dirty()
+        if changed:
+            self.db.save_citizen_states(changed)
+
     def shutdown(self) -> None:
         """Clean shutdown of the simulation."""
+        if self.db.conn is not None:
+            self._save_dirty_citizens()
         self.db.close()
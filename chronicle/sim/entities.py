@@ -4,7 +4,9 @@ from dataclasses import dataclass, field
 from typing import Optional
 import random
 
-from ..data.models import DOMAINS, CitizenRow, FactionRow, MythRow, GodRow
+import numpy as np
+
+from ..data.models import DOMAINS, DOMAIN_INDEX, BeliefVector, CitizenRow, FactionRow, MythRow, GodRow
 
 
 # Name generation pools
@@ -41,11 +43,25 @@ def generate_citizen_name(rng: random.Random) -> str:
     return rng.choice(CITIZEN_PREFIXES) + rng.choice(CITIZEN_SUFFIXES)
 
 
+def generate_citizen_names(n: int, rng: np.random.Generator) -> list[str]:
+    """Generate n random citizen names with two vectorized draws."""
+    prefixes = rng.integers(0, len(CITIZEN_PREFIXES), size=n).tolist()
+    suffixes = rng.integers(0, len(CITIZEN_SUFFIXES), size=n).tolist()
+    return [CITIZEN_PREFIXES[p] + CITIZEN_SUFFIXES[s] for p, s in zip(prefixes, suffixes)]
+
+
 def generate_faction_name(rng: random.Random) -> str:
     """Generate a random faction name."""
     return f"The {rng.choice(FACTION_ADJECTIVES)} {rng.choice(FACTION_NOUNS)}"
 
 
+def generate_faction_names(n: int, rng: np.random.Generator) -> list[str]:
+    """Generate n random faction names with two vectorized draws."""
+    adjectives = rng.integers(0, len(FACTION_ADJECTIVES), size=n).tolist()
+    nouns = rng.integers(0, len(FACTION_NOUNS), size=n).tolist()
+    return [f"The {FACTION_ADJECTIVES[a]} {FACTION_NOUNS[b]}" for a, b in zip(adjectives, nouns)]
+
+
 def generate_god_name(domain: str, rng: random.Random) -> str:
     """Generate a god name based on domain."""
     prefixes = GOD_PREFIXES.get(domain, GOD_PREFIXES["memory"])
@@ -58,12 +74,21 @@ class Citizen:
     row: CitizenRow
 
     @classmethod
-    def generate(cls, faction_id: Optional[int], rng: random.Random) -> "Citizen":
-        """Generate a new random citizen."""
-        belief_vector = {domain: rng.uniform(0, 0.3) for domain in DOMAINS}
+    def generate(
+        cls,
+        faction_id: Optional[int],
+        rng: random.Random,
+        name: Optional[str] = None,
+    ) -> "Citizen":
+        """Generate a new random citizen, drawing a name unless one is given."""
+        if name is None:
+            name = generate_citizen_name(rng)
+        belief_vector = BeliefVector(
+            np.array([rng.uniform(0, 0.3) for _ in DOMAINS], dtype=np.float32)
+        )
         return cls(CitizenRow(
             id=None,
-            name=generate_citizen_name(rng),
+            name=name,
             faction_id=faction_id,
             belief_vector=belief_vector,
             fear=rng.uniform(0.1, 0.4),
@@ -83,6 +108,83 @@ class Citizen:
         self.row.gratitude = max(0.0, min(1.0, self.row.gratitude + gratitude_delta))
 
 
+class CitizenTable:
+    """
+    Column (SoA) storage for citizen state, one row per citizen.
+
+    Beliefs live in a single (citizens, domains) float32 matrix with columns
+    in DOMAINS order. Each citizen's row.belief_vector is rebound to a
+    BeliefVector view of its matrix row, so per-citizen updates and
+    whole-population NumPy operations share the same storage.
+
+    Fear and gratitude are float64 columns; the update methods write the
+    new values back to each row so rows stay current for persistence.
+
+    The update methods also flag citizens whose values changed in dirty,
+    so only those rows need saving. Edits made directly through a row are
+    not tracked; call mark_dirty() or save the row yourself.
+    """
+
+    def __init__(self, citizens: list[Citizen]):
+        self.citizens = citizens
+        self.beliefs = np.zeros((len(citizens), len(DOMAINS)), dtype=np.float32)
+        self.fear = np.array([c.row.fear for c in citizens], dtype=np.float64)
+        self.gratitude = np.array([c.row.gratitude for c in citizens], dtype=np.float64)
+        self.dirty = np.zeros(len(citizens), dtype=bool)
+
+        for i, citizen in enumerate(citizens):
+            vector = citizen.row.belief_vector
+            if isinstance(vector, BeliefVector):
+                self.beliefs[i] = vector.values
+            else:
+                self.beliefs[i] = [vector.get(domain, 0.0) for domain in DOMAINS]
+            citizen.row.belief_vector = BeliefVector(self.beliefs[i])
+
+    def __len__(self) -> int:
+        return len(self.citizens)
+
+    def update_beliefs(self, domains: list[str], deltas: np.ndarray) -> None:
+        """
+        Add per-citizen deltas to distinct domains, clamped to [0, 1].
+
+        deltas has one column per entry in domains; all of them are updated
+        in a single pass.
+        """
+        columns = [DOMAIN_INDEX[domain] for domain in domains]
+        # Fancy indexing gathers a float32 copy; add and clamp it in place
+        updated = self.beliefs[:, columns]
+        np.add(updated, deltas, out=updated, casting="same_kind")
+        np.clip(updated, 0.0, 1.0, out=updated)
+        self.dirty |= (updated != self.beliefs[:, columns]).any(axis=1)
+        self.beliefs[:, columns] = updated
+
+    def update_emotions(self, fear_deltas: np.ndarray, gratitude_deltas: np.ndarray) -> None:
+        """Add per-citizen fear and gratitude deltas, clamped to [0, 1]."""
+        fear = self.fear + fear_deltas
+        np.clip(fear, 0.0, 1.0, out=fear)
+        gratitude = self.gratitude + gratitude_deltas
+        np.clip(gratitude, 0.0, 1.0, out=gratitude)
+        changed = (fear != self.fear) | (gratitude != self.gratitude)
+        self.fear = fear
+        self.gratitude = gratitude
+        self.dirty |= changed
+
+        for i in np.flatnonzero(changed).tolist():
+            row = self.citizens[i].row
+            row.fear = fear[i].item()
+            row.gratitude = gratitude[i].item()
+
+    def mark_dirty(self) -> None:
+        """Flag every citizen for saving, e.g. after editing rows directly."""
+        self.dirty[:] = True
+
+    def pop_dirty(self) -> list[CitizenRow]:
+        """Return the rows of changed citizens and clear their flags."""
+        rows = [self.citizens[i].row for i in np.flatnonzero(self.dirty).tolist()]
+        self.dirty[:] = False
+        return rows
+
+
 @dataclass
 class Faction:
     """A faction with shared beliefs."""
@@ -90,17 +192,20 @@ class Faction:
     members: list[Citizen] = field(default_factory=list)
 
     @classmethod
-    def generate(cls, rng: random.Random) -> "Faction":
-        """Generate a new random faction."""
+    def generate(cls, rng: random.Random, name: Optional[str] = None) -> "Faction":
+        """Generate a new random faction, drawing a name unless one is given."""
         # Create a doctrine bias favoring 1-2 domains
         doctrine = {domain: rng.uniform(0.1, 0.4) for domain in DOMAINS}
         favored = rng.sample(DOMAINS, k=rng.randint(1, 2))
         for domain in favored:
             doctrine[domain] = rng.uniform(0.7, 1.0)
+        # Doctrines are stored as float32; round now so a restored world
+        # applies exactly the bias the live one did
+        doctrine = {domain: float(np.float32(value)) for domain, value in doctrine.items()}
 
         return cls(FactionRow(
             id=None,
-            name=generate_faction_name(rng),
+            name=name if name is not None else generate_faction_name(rng),
             doctrine_bias=doctrine,
         ))
 
@@ -138,6 +243,11 @@ class Myth:
 class God:
     """An emergent deity."""
     row: GodRow
+    # Title-cased domain for narration; a god's domain never changes
+    domain_title: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.domain_title = self.row.domain.title()
 
     @classmethod
     def birth(cls, domain: str, belief_strength: float, coherence: float, day: int, rng: random.Random) -> "God":
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from typing import Optional
 import random
 
+import numpy as np
+
 from ..data.models import DOMAINS
 from .ages import Age
 
@@ -67,6 +69,25 @@ EVENT_TEMPLATES = {
     ],
 }
 
+# EVENT_TEMPLATES flattened to (domain index, template index) tables: names
+# and descriptions as nested lists, impacts as float arrays
+EVENT_NAMES = [[t[0] for t in EVENT_TEMPLATES[d]] for d in DOMAINS]
+EVENT_DESCRIPTIONS = [[t[1] for t in EVENT_TEMPLATES[d]] for d in DOMAINS]
+EVENT_FEAR = np.array([[t[2] for t in EVENT_TEMPLATES[d]] for d in DOMAINS])
+EVENT_GRATITUDE = np.array([[t[3] for t in EVENT_TEMPLATES[d]] for d in DOMAINS])
+EVENT_BELIEF = np.array([[t[4] for t in EVENT_TEMPLATES[d]] for d in DOMAINS])
+TEMPLATES_PER_DOMAIN = EVENT_FEAR.shape[1]
+
+# For each domain index, the indices of every other domain (secondary picks)
+_OTHER_DOMAINS = tuple(
+    tuple(j for j in range(len(DOMAINS)) if j != i)
+    for i in range(len(DOMAINS))
+)
+
+# Uniform draws per day, in order: event gate, primary domain, template,
+# secondary gate, secondary domain, magnitude jitter
+_EVENT_ROLLS = 6
+
 # Age-specific event modifiers
 AGE_EVENT_MODIFIERS = {
     Age.EMERGENCE: {"magnitude_boost": 0.1, "positive_bias": 0.1},
@@ -81,28 +102,37 @@ AGE_EVENT_MODIFIERS = {
 class EventGenerator:
     """Generates events based on world state."""
 
-    def __init__(self, rng: random.Random):
+    def __init__(self, rng: random.Random, np_rng: Optional[np.random.Generator] = None):
         self.rng = rng
+        # Daily event rolls; seeded from rng when no Generator is shared
+        self.np_rng = np_rng if np_rng is not None else np.random.default_rng(rng.getrandbits(64))
 
     def generate_event(self, age: Age, event_rate: float) -> Optional[Event]:
         """Generate an event for the current day."""
-        if self.rng.random() > event_rate:
+        # All of the day's randomness in one draw, mapped to picks below
+        gate, primary_roll, template_roll, secondary_gate, secondary_roll, magnitude_roll = (
+            self.np_rng.random(_EVENT_ROLLS).tolist()
+        )
+        if gate > event_rate:
             return None
 
         # Choose primary domain
-        primary_domain = self.rng.choice(DOMAINS)
-        templates = EVENT_TEMPLATES[primary_domain]
-        name, desc, fear, grat, belief = self.rng.choice(templates)
+        primary_index = int(primary_roll * len(DOMAINS))
+        primary_domain = DOMAINS[primary_index]
+        k = int(template_roll * TEMPLATES_PER_DOMAIN)
+        fear = EVENT_FEAR[primary_index, k].item()
+        grat = EVENT_GRATITUDE[primary_index, k].item()
+        belief = EVENT_BELIEF[primary_index, k].item()
 
         # Maybe add secondary domain
         secondary_domain = None
-        if self.rng.random() < 0.3:
-            others = [d for d in DOMAINS if d != primary_domain]
-            secondary_domain = self.rng.choice(others)
+        if secondary_gate < 0.3:
+            others = _OTHER_DOMAINS[primary_index]
+            secondary_domain = DOMAINS[others[int(secondary_roll * len(others))]]
 
         # Apply age modifiers
         modifiers = AGE_EVENT_MODIFIERS[age]
-        magnitude = 0.5 + self.rng.uniform(-0.2, 0.2) + modifiers["magnitude_boost"]
+        magnitude = 0.5 + (magnitude_roll * 0.4 - 0.2) + modifiers["magnitude_boost"]
         magnitude = max(0.1, min(1.0, magnitude))
 
         # Adjust fear/gratitude based on age bias
@@ -111,8 +141,8 @@ class EventGenerator:
         grat = grat + bias * 0.2
 
         return Event(
-            name=name,
-            description=desc,
+            name=EVENT_NAMES[primary_index][k],
+            description=EVENT_DESCRIPTIONS[primary_index][k],
             primary_domain=primary_domain,
             secondary_domain=secondary_domain,
             fear_impact=fear * magnitude,
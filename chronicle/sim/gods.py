@@ -4,7 +4,9 @@ from dataclasses import dataclass
 from typing import Optional
 import random
 
-from ..data.models import DOMAINS, GodRow
+import numpy as np
+
+from ..data.models import DOMAINS, DOMAIN_INDEX, GodRow
 from ..data.database import Database
 from .entities import God, Citizen
 
@@ -15,6 +17,7 @@ COHERENCE_THRESHOLD = 0.5  # minimum coherence (agreement) among believers
 CONSECUTIVE_DAYS_BIRTH = 5  # days above threshold to birth
 CONSECUTIVE_DAYS_FADE = 7  # days below threshold to fade
 FADE_THRESHOLD = 0.3  # belief below this starts fade counter
+BELIEVER_THRESHOLD = 0.3  # a citizen counts as a believer above this
 
 
 @dataclass
@@ -33,65 +36,81 @@ class GodSystem:
     def __init__(self, db: Database, rng: random.Random):
         self.db = db
         self.rng = rng
-        # Track consecutive days for proto-gods (domains approaching godhood)
-        self._proto_god_days: dict[str, int] = {domain: 0 for domain in DOMAINS}
-
-    def aggregate_beliefs(self, citizens: list[Citizen]) -> dict[str, BeliefAggregation]:
-        """Calculate aggregate belief for each domain."""
-        aggregations = {}
-
-        for domain in DOMAINS:
-            beliefs = [c.row.belief_vector.get(domain, 0.0) for c in citizens]
-            if not beliefs:
-                aggregations[domain] = BeliefAggregation(
-                    domain=domain,
-                    total_belief=0.0,
-                    believer_count=0,
-                    average_belief=0.0,
-                    coherence=0.0,
-                )
-                continue
-
-            total = sum(beliefs)
-            avg = total / len(beliefs)
-
-            # Coherence: inverse of variance (normalized)
-            variance = sum((b - avg) ** 2 for b in beliefs) / len(beliefs)
-            coherence = max(0.0, 1.0 - variance * 4)  # scale variance to 0-1
-
-            # Count believers (those with belief > 0.3)
-            believer_count = sum(1 for b in beliefs if b > 0.3)
-
-            aggregations[domain] = BeliefAggregation(
+        # Track consecutive days for proto-gods (domains approaching godhood),
+        # one counter per domain in DOMAINS order
+        self._proto_god_days = np.zeros(len(DOMAINS), dtype=np.int64)
+        # Living gods in birth order, loaded once; the database is only
+        # written through from here on
+        self._living_gods = [God(row) for row in db.get_all_gods(alive_only=True)]
+
+    def get_living_gods(self) -> list[God]:
+        """Get the gods currently alive, in birth order."""
+        return self._living_gods
+
+    def _domain_stats(self, beliefs: np.ndarray) -> tuple[np.ndarray, ...]:
+        """
+        Per-domain (totals, averages, coherences, believer_counts) arrays.
+
+        beliefs is the (citizens, domains) matrix from CitizenTable, with
+        columns in DOMAINS order; statistics are taken per column.
+        """
+        if len(beliefs) == 0:
+            zeros = np.zeros(len(DOMAINS))
+            return zeros, zeros, zeros, np.zeros(len(DOMAINS), dtype=np.int64)
+
+        # Reduce each domain column (axis 0) of the C-ordered float32 matrix
+        # directly, accumulating in float64 so large populations don't lose
+        # precision, instead of materializing a float64 copy first
+        totals = beliefs.sum(axis=0, dtype=np.float64)
+        averages = beliefs.mean(axis=0, dtype=np.float64)
+
+        # Coherence: inverse of variance (normalized), 1 - 4 * var clamped at
+        # 0, computed in place over np.var's result
+        coherences = beliefs.var(axis=0, dtype=np.float64)
+        coherences *= 4  # scale variance to 0-1
+        np.subtract(1.0, coherences, out=coherences)
+        np.maximum(coherences, 0.0, out=coherences)
+
+        # Compare against the float64 threshold, as the scalar code did
+        believer_counts = (beliefs > np.float64(BELIEVER_THRESHOLD)).sum(axis=0)
+
+        return totals, averages, coherences, believer_counts
+
+    def aggregate_beliefs(self, beliefs: np.ndarray) -> dict[str, BeliefAggregation]:
+        """Calculate aggregate belief for each domain of a belief matrix."""
+        totals, averages, coherences, believer_counts = self._domain_stats(beliefs)
+        return {
+            domain: BeliefAggregation(
                 domain=domain,
-                total_belief=total,
-                believer_count=believer_count,
-                average_belief=avg,
-                coherence=coherence,
+                total_belief=float(totals[i]),
+                believer_count=int(believer_counts[i]),
+                average_belief=float(averages[i]),
+                coherence=float(coherences[i]),
             )
-
-        return aggregations
+            for i, domain in enumerate(DOMAINS)
+        }
 
     def process_gods(
         self,
-        citizens: list[Citizen],
+        beliefs: np.ndarray,
         current_day: int
     ) -> tuple[list[God], list[God]]:
         """
         Process god births and deaths for this tick.
         Returns (newly_born_gods, newly_faded_gods).
         """
-        aggregations = self.aggregate_beliefs(citizens)
+        _, averages, coherences, _ = self._domain_stats(beliefs)
+        weak = averages < FADE_THRESHOLD
         born = []
         faded = []
 
         # Check existing gods for fading
-        existing_gods = [God(row) for row in self.db.get_all_gods(alive_only=True)]
+        existing_gods = self._living_gods
         for god in existing_gods:
-            agg = aggregations[god.row.domain]
-            god.update_strength(agg.average_belief, agg.coherence)
+            i = DOMAIN_INDEX[god.row.domain]
+            god.update_strength(float(averages[i]), float(coherences[i]))
 
-            if agg.average_belief < FADE_THRESHOLD:
+            if weak[i]:
                 god.row.consecutive_weak_days += 1
                 god.row.consecutive_strong_days = 0
                 if god.row.consecutive_weak_days >= CONSECUTIVE_DAYS_FADE:
@@ -101,31 +120,32 @@ class GodSystem:
                 god.row.consecutive_weak_days = 0
                 god.row.consecutive_strong_days += 1
 
-            self.db.save_god(god.row)
-
-        # Check for new god births
-        living_domains = {g.row.domain for g in existing_gods if g.row.alive}
-
-        for domain, agg in aggregations.items():
-            if domain in living_domains:
-                self._proto_god_days[domain] = 0
-                continue
-
-            if agg.average_belief >= BELIEF_THRESHOLD and agg.coherence >= COHERENCE_THRESHOLD:
-                self._proto_god_days[domain] += 1
-                if self._proto_god_days[domain] >= CONSECUTIVE_DAYS_BIRTH:
-                    god = God.birth(
-                        domain=domain,
-                        belief_strength=agg.average_belief,
-                        coherence=agg.coherence,
-                        day=current_day,
-                        rng=self.rng
-                    )
-                    self.db.save_god(god.row)
-                    born.append(god)
-                    self._proto_god_days[domain] = 0
-            else:
-                self._proto_god_days[domain] = 0
+        # Advance every domain's proto-god counter at once: domains with a
+        # living god or below the thresholds reset, the rest count up
+        living = np.zeros(len(DOMAINS), dtype=bool)
+        for god in existing_gods:
+            if god.row.alive:
+                living[DOMAIN_INDEX[god.row.domain]] = True
+        rising = (averages >= BELIEF_THRESHOLD) & (coherences >= COHERENCE_THRESHOLD) & ~living
+        proto = np.where(rising, self._proto_god_days + 1, 0)
+
+        # Birth gods for domains that stayed above threshold long enough
+        ready = proto >= CONSECUTIVE_DAYS_BIRTH
+        for i in np.flatnonzero(ready).tolist():
+            born.append(God.birth(
+                domain=DOMAINS[i],
+                belief_strength=float(averages[i]),
+                coherence=float(coherences[i]),
+                day=current_day,
+                rng=self.rng
+            ))
+        proto[ready] = 0
+        self._proto_god_days = proto
+
+        self._living_gods = [g for g in existing_gods if g.row.alive] + born
+
+        # One write for every existing god's update and every birth
+        self.db.save_gods([g.row for g in existing_gods + born])
 
         return born, faded
 
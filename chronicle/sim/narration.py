@@ -1,46 +1,60 @@
 """Epic narration system for Living Chronicle."""
 
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional
+import bisect
+import os
 import random
+import sys
 
 from .ages import Age
 from .entities import God
 from .events import Event
 
+if TYPE_CHECKING:
+    from .engine import TickResult
 
-# Epic phrases for different situations
-AGE_TRANSITION_PHRASES = {
-    Age.EMERGENCE: [
+
+# Epic phrases for different situations. The lookup tables are read-only:
+# the tables narration actually indexes are derived from them at import
+AGE_TRANSITION_PHRASES = MappingProxyType({
+    Age.EMERGENCE: (
         "From the void, new light stirs. The Age of Emergence begins.",
         "The world awakens. An Age of Emergence dawns upon the land.",
         "Silence breaks. The Age of Emergence rises from primordial dark.",
-    ],
-    Age.ORDER: [
+    ),
+    Age.ORDER: (
         "Laws bind the chaos. The Age of Order commences.",
         "Structure takes hold. The Age of Order begins its reign.",
         "From turbulence, pattern emerges. The Age of Order is upon us.",
-    ],
-    Age.STRAIN: [
+    ),
+    Age.STRAIN: (
         "Cracks appear in the foundation. The Age of Strain begins.",
         "Old certainties falter. The Age of Strain descends.",
         "The weight of ages bears down. Strain marks this era.",
-    ],
-    Age.COLLAPSE: [
+    ),
+    Age.COLLAPSE: (
         "All that was built now crumbles. The Age of Collapse is here.",
         "Pillars shatter. The Age of Collapse consumes the world.",
         "What rose must fall. The Age of Collapse begins its terrible work.",
-    ],
-    Age.SILENCE: [
+    ),
+    Age.SILENCE: (
         "The tumult fades to nothing. The Age of Silence settles.",
         "Even echoes die. The Age of Silence blankets the land.",
         "In the aftermath, only quiet remains. The Age of Silence.",
-    ],
-    Age.REBIRTH: [
+    ),
+    Age.REBIRTH: (
         "From ashes, green shoots. The Age of Rebirth begins.",
         "Hope stirs in barren soil. The Age of Rebirth awakens.",
         "The cycle turns anew. Rebirth comes to a waiting world.",
-    ],
-}
+    ),
+})
+
+# Transition phrases by Age.ordinal, so lookups skip hashing the enum
+_AGE_PHRASES_BY_ORDINAL = tuple(AGE_TRANSITION_PHRASES[age] for age in Age)
+
+# Fixed tail of each age's day header, by Age.ordinal
+_DAY_HEADER_SUFFIX_BY_ORDINAL = tuple(f" · Age of {age.value} ═══" for age in Age)
 
 GOD_BIRTH_PHRASES = [
     "The faithful's prayers coalesce into divine form. {name}, God of {domain}, is born!",
@@ -58,6 +72,10 @@ GOD_FADE_PHRASES = [
     "Faith wavers, and with it, {name} descends into eternal silence.",
 ]
 
+# Bound str.format of each phrase, so narration skips the method lookup
+_GOD_BIRTH_FORMATS = tuple(phrase.format for phrase in GOD_BIRTH_PHRASES)
+_GOD_FADE_FORMATS = tuple(phrase.format for phrase in GOD_FADE_PHRASES)
+
 EVENT_MAGNITUDE_WORDS = {
     "low": ["A minor", "A small", "A brief"],
     "medium": ["A significant", "A notable", "An important"],
@@ -65,14 +83,52 @@ EVENT_MAGNITUDE_WORDS = {
     "extreme": ["A cataclysmic", "An apocalyptic", "A world-shaking"],
 }
 
-DOMAIN_EPITHETS = {
+# Banner rules around age transitions and god births/fades
+_RULE_EQ60 = "=" * 60
+_RULE_EQ50 = "=" * 50
+_RULE_STAR40 = "★" * 40
+_RULE_DAG40 = "†" * 40
+
+
+def _banner(rule: str) -> tuple[str, str]:
+    """The text written before and after a banner's line, newlines included."""
+    return f"\n{rule}\n", f"\n{rule}\n"
+
+
+_BANNER_EQ60 = _banner(_RULE_EQ60)
+_BANNER_EQ50 = _banner(_RULE_EQ50)
+_BANNER_STAR40 = _banner(_RULE_STAR40)
+_BANNER_DAG40 = _banner(_RULE_DAG40)
+
+# Upper magnitude bounds of the low/medium/high buckets; anything above is extreme
+_MAGNITUDE_THRESHOLDS = (0.3, 0.6, 0.85)
+_MAG_WORDS_BY_BUCKET = (
+    EVENT_MAGNITUDE_WORDS["low"],
+    EVENT_MAGNITUDE_WORDS["medium"],
+    EVENT_MAGNITUDE_WORDS["high"],
+    EVENT_MAGNITUDE_WORDS["extreme"],
+)
+
+DOMAIN_EPITHETS = MappingProxyType({
     "river": "of the Waters",
     "flame": "of the Eternal Fire",
     "sky": "of the Heavens",
     "war": "of Battle",
     "harvest": "of the Bountiful Earth",
     "memory": "of the Ageless Past",
+})
+
+# The fixed parts of event narration, built once per domain: the omen
+# between the magnitude word and the event name, and the tail after the
+# description (with the echoes line when there is a secondary domain)
+_EVENT_OMENS = {domain: f" omen {epithet}: " for domain, epithet in DOMAIN_EPITHETS.items()}
+_UNKNOWN_OMEN = " omen of Unknown Power: "
+_EVENT_TAILS = {
+    domain: f".\n  Echoes stir in the realm {epithet}."
+    for domain, epithet in DOMAIN_EPITHETS.items()
 }
+_EVENT_TAILS[None] = _EVENT_TAILS[""] = "."
+_UNKNOWN_TAIL = ".\n  Echoes stir in the realm ."
 
 
 class Narrator:
@@ -81,121 +137,129 @@ class Narrator:
     def __init__(self, rng: random.Random, quiet: bool = False):
         self.rng = rng
         self.quiet = quiet
+        # Draws the same index random.choice would, without its method overhead
+        self._randrange = rng.randrange
+        # Lines for the tick being narrated, written to stdout in one call
+        self._buf: list[str] = []
+        # On a terminal, ticks go straight to the stdout descriptor with
+        # os.write; redirected or captured stdout keeps the sys.stdout path
+        self._fd: Optional[int] = None
+        if not quiet and sys.stdout.isatty():
+            self._fd = sys.stdout.fileno()
+            self._encoding = sys.stdout.encoding
+        if quiet:
+            # Callers hold print_tick, so quiet runs never enter the narration
+            self.print_tick = self._print_nothing
 
     def narrate_age_transition(self, new_age: Age) -> str:
         """Narrate an age transition."""
-        phrases = AGE_TRANSITION_PHRASES[new_age]
-        return self.rng.choice(phrases)
+        phrases = _AGE_PHRASES_BY_ORDINAL[new_age.ordinal]
+        return phrases[self._randrange(len(phrases))]
 
     def narrate_god_birth(self, god: God) -> str:
         """Narrate the birth of a god."""
-        phrase = self.rng.choice(GOD_BIRTH_PHRASES)
-        domain_title = god.row.domain.title()
-        return phrase.format(name=god.row.name, domain=domain_title)
+        fmt = _GOD_BIRTH_FORMATS[self._randrange(len(_GOD_BIRTH_FORMATS))]
+        return fmt(name=god.row.name, domain=god.domain_title)
 
     def narrate_god_fade(self, god: God) -> str:
         """Narrate the fading of a god."""
-        phrase = self.rng.choice(GOD_FADE_PHRASES)
-        domain_title = god.row.domain.title()
-        return phrase.format(name=god.row.name, domain=domain_title)
+        fmt = _GOD_FADE_FORMATS[self._randrange(len(_GOD_FADE_FORMATS))]
+        return fmt(name=god.row.name, domain=god.domain_title)
 
     def narrate_event(self, event: Event, day: int, age: Age) -> str:
         """Narrate an event."""
         # Determine magnitude description
-        if event.magnitude < 0.3:
-            mag_words = EVENT_MAGNITUDE_WORDS["low"]
-        elif event.magnitude < 0.6:
-            mag_words = EVENT_MAGNITUDE_WORDS["medium"]
-        elif event.magnitude < 0.85:
-            mag_words = EVENT_MAGNITUDE_WORDS["high"]
-        else:
-            mag_words = EVENT_MAGNITUDE_WORDS["extreme"]
+        mag_words = _MAG_WORDS_BY_BUCKET[bisect.bisect_right(_MAGNITUDE_THRESHOLDS, event.magnitude)]
 
-        mag_word = self.rng.choice(mag_words)
-        epithet = DOMAIN_EPITHETS.get(event.primary_domain, "of Unknown Power")
+        mag_word = mag_words[self._randrange(len(mag_words))]
+        omen = _EVENT_OMENS.get(event.primary_domain, _UNKNOWN_OMEN)
+        tail = _EVENT_TAILS.get(event.secondary_domain, _UNKNOWN_TAIL)
+        return f"{mag_word}{omen}{event.name}.\n  {event.description}{tail}"
 
-        lines = [f"{mag_word} omen {epithet}: {event.name}."]
-        lines.append(f"  {event.description}.")
+    def narrate_day_header(self, day: int, age: Age) -> str:
+        """Create a day header."""
+        return f"\n═══ Day {day}{_DAY_HEADER_SUFFIX_BY_ORDINAL[age.ordinal]}"
 
-        if event.secondary_domain:
-            secondary_epithet = DOMAIN_EPITHETS.get(event.secondary_domain, "")
-            lines.append(f"  Echoes stir in the realm {secondary_epithet}.")
+    def _print_nothing(self, result: "TickResult") -> None:
+        """print_tick for quiet narrators."""
 
-        return "\n".join(lines)
+    def _write(self, text: str) -> None:
+        """Queue one line of narration for the current tick."""
+        self._buf.append(text)
+        self._buf.append("\n")
 
-    def narrate_day_header(self, day: int, age: Age) -> str:
-        """Create a day header."""
-        return f"\n═══ Day {day} · Age of {age.value} ═══"
+    def _write_banner(self, banner: tuple[str, str], text: str) -> None:
+        """Queue a line framed by a banner's rules."""
+        before, after = banner
+        self._buf += (before, text, after)
 
-    def print_tick(self, result) -> None:
-        """Print narration for a tick result."""
-        if self.quiet:
+    def _flush(self) -> None:
+        """Write the current tick's narration to stdout."""
+        if not self._buf:
             return
+        text = "".join(self._buf)
+        self._buf.clear()
+        if self._fd is None:
+            sys.stdout.write(text)
+            return
+        data = memoryview(text.encode(self._encoding, "replace"))
+        while data:
+            data = data[os.write(self._fd, data):]
 
-        from .engine import TickResult
-        result: TickResult = result
-
+    def print_tick(self, result: "TickResult") -> None:
+        """Print narration for a tick result."""
         # Age transition is most important
         if result.age_transition:
-            print("\n" + "=" * 60)
-            print(self.narrate_age_transition(result.age_transition))
-            print("=" * 60)
+            self._write_banner(_BANNER_EQ60, self.narrate_age_transition(result.age_transition))
 
         # God births
-        for god in result.born_gods:
-            print("\n" + "★" * 40)
-            print(self.narrate_god_birth(god))
-            print("★" * 40)
+        if result.born_gods:
+            for god in result.born_gods:
+                self._write_banner(_BANNER_STAR40, self.narrate_god_birth(god))
 
         # God fades
-        for god in result.faded_gods:
-            print("\n" + "†" * 40)
-            print(self.narrate_god_fade(god))
-            print("†" * 40)
+        if result.faded_gods:
+            for god in result.faded_gods:
+                self._write_banner(_BANNER_DAG40, self.narrate_god_fade(god))
 
         # Major events (high magnitude only in normal mode)
         if result.event and result.event.magnitude >= 0.5:
-            print(self.narrate_day_header(result.day, result.age))
-            print(self.narrate_event(result.event, result.day, result.age))
+            self._write(self.narrate_day_header(result.day, result.age))
+            self._write(self.narrate_event(result.event, result.day, result.age))
+
+        self._flush()
 
 
 class VerboseNarrator(Narrator):
     """Narrator that shows all events."""
 
-    def print_tick(self, result) -> None:
+    def print_tick(self, result: "TickResult") -> None:
         """Print narration for a tick result."""
-        if self.quiet:
-            return
-
-        from .engine import TickResult
-        result: TickResult = result
-
-        print(self.narrate_day_header(result.day, result.age))
+        self._write(self.narrate_day_header(result.day, result.age))
 
         # Age transition
         if result.age_transition:
-            print("\n" + "=" * 50)
-            print(self.narrate_age_transition(result.age_transition))
-            print("=" * 50)
+            self._write_banner(_BANNER_EQ50, self.narrate_age_transition(result.age_transition))
 
         # Events
         if result.event:
-            print(self.narrate_event(result.event, result.day, result.age))
+            self._write(self.narrate_event(result.event, result.day, result.age))
         else:
-            print("  The day passes without portent.")
+            self._write("  The day passes without portent.")
 
         # God births
-        for god in result.born_gods:
-            print("\n" + "★" * 40)
-            print(self.narrate_god_birth(god))
-            print("★" * 40)
+        if result.born_gods:
+            for god in result.born_gods:
+                self._write_banner(_BANNER_STAR40, self.narrate_god_birth(god))
 
         # God fades
-        for god in result.faded_gods:
-            print("\n" + "†" * 40)
-            print(self.narrate_god_fade(god))
-            print("†" * 40)
+        if result.faded_gods:
+            for god in result.faded_gods:
+                self._write_banner(_BANNER_DAG40, self.narrate_god_fade(god))
 
         # Myths created
-        for myth in result.new_myths:
-            print(f"  A new myth is spoken: \"{myth.row.text}\"")
+        if result.new_myths:
+            for myth in result.new_myths:
+                self._write(f"  A new myth is spoken: \"{myth.row.text}\"")
+
+        self._flush()
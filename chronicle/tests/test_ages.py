@@ -1,6 +1,7 @@
 """Tests for age cycle transitions."""
 
 import random
+from itertools import pairwise
 import pytest
 
 from chronicle.sim.ages import Age, AgeManager, AGE_TRAITS
@@ -19,8 +20,8 @@ def test_age_cycle_order():
     ]
 
     # Verify next() method
-    for i in range(len(expected_order) - 1):
-        assert expected_order[i].next() == expected_order[i + 1]
+    for age, following in pairwise(expected_order):
+        assert age.next() == following
 
 
 def test_age_manager_starts_at_emergence():
@@ -59,26 +60,20 @@ def test_full_cycle():
     manager = AgeManager.new(rng)
 
     # Track all ages we pass through
-    ages_seen = [manager.current_age]
+    ages_seen = {manager.current_age}
 
     # Force short durations and run through a full cycle
     max_ticks = 1000
     for _ in range(max_ticks):
         manager.age_duration = min(manager.age_duration, 3)  # Cap duration
         result = manager.tick()
-        if result and result not in ages_seen:
-            ages_seen.append(result)
+        if result:
+            ages_seen.add(result)
         if len(ages_seen) >= 6:
             break
 
     # Should have seen all 6 ages
-    assert len(ages_seen) >= 6
-    assert Age.EMERGENCE in ages_seen
-    assert Age.ORDER in ages_seen
-    assert Age.STRAIN in ages_seen
-    assert Age.COLLAPSE in ages_seen
-    assert Age.SILENCE in ages_seen
-    assert Age.REBIRTH in ages_seen
+    assert ages_seen >= set(Age)
 
 
 def test_age_traits_exist():
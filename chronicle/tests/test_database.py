@@ -0,0 +1,177 @@
+"""Tests for the SQLite persistence layer."""
+
+import json
+import os
+import tempfile
+import pytest
+
+from chronicle.data import Database, CitizenRow, GodRow, WorldStateRow
+from chronicle.data.models import DOMAINS
+
+
+def test_belief_vector_round_trip():
+    """Belief vectors survive a save/load as packed float32 blobs."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(os.path.join(tmpdir, "test_blob.db"))
+        db.connect()
+
+        beliefs = {domain: i / 10 for i, domain in enumerate(DOMAINS)}
+        citizen = CitizenRow(
+            id=None, name="Ashel", faction_id=None,
+            belief_vector=beliefs, fear=0.2, gratitude=0.3,
+        )
+        db.save_citizen(citizen)
+
+        loaded = db.get_all_citizens()[0]
+        assert list(loaded.belief_vector) == DOMAINS
+        for domain in DOMAINS:
+            assert loaded.belief_vector[domain] == pytest.approx(beliefs[domain], abs=1e-6)
+
+        db.close()
+
+
+def test_legacy_json_vectors_still_load():
+    """Rows written before the blob encoding (JSON text) are still readable."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(os.path.join(tmpdir, "test_legacy.db"))
+        db.connect()
+
+        doctrine = {domain: 0.5 for domain in DOMAINS}
+        db.conn.execute(
+            "INSERT INTO factions (name, doctrine_bias) VALUES (?, ?)",
+            ("The Ashen Pact", json.dumps(doctrine)),
+        )
+        db.conn.commit()
+
+        faction = db.get_all_factions()[0]
+        assert faction.doctrine_bias == doctrine
+
+        # Re-saving converts it to the blob encoding
+        db.save_faction(faction)
+        stored = db.conn.execute("SELECT doctrine_bias FROM factions").fetchone()[0]
+        assert isinstance(stored, bytes)
+        assert db.get_all_factions()[0].doctrine_bias == pytest.approx(doctrine)
+
+        db.close()
+
+
+def test_legacy_json_vectors_migrate_on_connect():
+    """Opening a database rewrites JSON vectors left by older versions as blobs."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "test_migrate.db")
+        db = Database(path)
+        db.connect()
+
+        beliefs = {domain: 0.25 for domain in DOMAINS}
+        db.conn.execute(
+            "INSERT INTO citizens (name, belief_vector, fear, gratitude) VALUES (?, ?, ?, ?)",
+            ("Ashel", json.dumps(beliefs), 0.1, 0.2),
+        )
+        db.conn.commit()
+        db.close()
+
+        db = Database(path)
+        db.connect()
+        stored = db.conn.execute("SELECT belief_vector FROM citizens").fetchone()[0]
+        assert isinstance(stored, bytes)
+        assert dict(db.get_all_citizens()[0].belief_vector) == pytest.approx(beliefs)
+
+        db.close()
+
+
+def test_world_state_updates_in_place():
+    """Day advances and age changes both reach the stored world state."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "test_world.db")
+        db = Database(path)
+        db.connect()
+
+        db.save_world_state(WorldStateRow(id=1, current_day=1, current_age="Emergence", age_day_counter=1, seed=7))
+        db.save_world_state(WorldStateRow(id=1, current_day=2, current_age="Emergence", age_day_counter=2, seed=7))
+        db.save_world_state(WorldStateRow(id=1, current_day=3, current_age="Order", age_day_counter=0, seed=7))
+        db.close()
+
+        db = Database(path)
+        db.connect()
+        state = db.get_world_state()
+        assert (state.current_day, state.current_age, state.age_day_counter, state.seed) == (3, "Order", 0, 7)
+
+        db.save_world_state(WorldStateRow(id=1, current_day=4, current_age="Order", age_day_counter=1, seed=7))
+        assert db.get_world_state().current_day == 4
+
+        db.close()
+
+
+def test_transaction_commits_once_or_rolls_back():
+    """Writes inside transaction() are kept together or dropped together."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(os.path.join(tmpdir, "test_txn.db"))
+        db.connect()
+
+        def citizen(name):
+            return CitizenRow(
+                id=None, name=name, faction_id=None,
+                belief_vector={}, fear=0.0, gratitude=0.0,
+            )
+
+        with db.transaction():
+            db.save_citizen(citizen("Ashel"))
+            with db.transaction():
+                db.save_citizen(citizen("Brannoc"))
+            assert db.conn.in_transaction
+        assert not db.conn.in_transaction
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.save_citizen(citizen("Corva"))
+                raise RuntimeError("tick failed")
+
+        assert [c.name for c in db.get_all_citizens()] == ["Ashel", "Brannoc"]
+
+        db.close()
+
+
+def test_gods_partitioned_by_alive():
+    """Living and fallen gods come back as separate lists in birth order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(os.path.join(tmpdir, "test_gods.db"))
+        db.connect()
+
+        db.save_gods([
+            GodRow(id=None, name="Vess", domain="war", belief_strength=0.6,
+                   coherence=0.5, alive=False, birth_day=3, death_day=9),
+            GodRow(id=None, name="Orun", domain="harvest", belief_strength=0.7,
+                   coherence=0.6, alive=True, birth_day=5),
+            GodRow(id=None, name="Ilka", domain="river", belief_strength=0.8,
+                   coherence=0.7, alive=True, birth_day=2),
+        ])
+
+        living, fallen = db.get_gods_partitioned()
+        assert [g.name for g in living] == ["Ilka", "Orun"]
+        assert [g.name for g in fallen] == ["Vess"]
+
+        db.close()
+
+
+def test_save_citizen_states_updates_tick_columns():
+    """The narrow per-tick update persists beliefs and emotions."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(os.path.join(tmpdir, "test_states.db"))
+        db.connect()
+
+        citizen = CitizenRow(
+            id=None, name="Ashel", faction_id=None,
+            belief_vector={domain: 0.1 for domain in DOMAINS}, fear=0.2, gratitude=0.3,
+        )
+        db.save_citizen(citizen)
+
+        citizen.belief_vector["war"] = 0.9
+        citizen.fear = 0.7
+        db.save_citizen_states([citizen])
+
+        loaded = db.get_all_citizens()[0]
+        assert loaded.name == "Ashel"
+        assert loaded.belief_vector["war"] == pytest.approx(0.9)
+        assert loaded.fear == pytest.approx(0.7)
+
+        db.close()
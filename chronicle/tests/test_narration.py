@@ -0,0 +1,44 @@
+"""Tests for simulation narration."""
+
+import random
+import pytest
+
+from chronicle.sim.ages import Age
+from chronicle.sim.events import Event
+from chronicle.sim.narration import Narrator, EVENT_MAGNITUDE_WORDS
+
+
+def _event(magnitude, secondary_domain=None):
+    return Event(
+        name="The Long Rain",
+        description="The rivers rise past their banks",
+        primary_domain="river",
+        secondary_domain=secondary_domain,
+        fear_impact=0.1,
+        gratitude_impact=0.1,
+        belief_impact=0.1,
+        magnitude=magnitude,
+    )
+
+
+@pytest.mark.parametrize("magnitude,bucket", [
+    (0.0, "low"),
+    (0.29, "low"),
+    (0.3, "medium"),
+    (0.6, "high"),
+    (0.85, "extreme"),
+    (1.0, "extreme"),
+])
+def test_event_magnitude_words(magnitude, bucket):
+    """Magnitudes at a bucket threshold use the higher bucket's wording."""
+    narrator = Narrator(random.Random(1))
+    text = narrator.narrate_event(_event(magnitude), day=1, age=Age.EMERGENCE)
+    assert any(text.startswith(word + " omen") for word in EVENT_MAGNITUDE_WORDS[bucket])
+
+
+def test_event_narration_lines():
+    """The secondary domain adds a third line to the event narration."""
+    narrator = Narrator(random.Random(1))
+    assert narrator.narrate_event(_event(0.5), 1, Age.ORDER).count("\n") == 1
+    text = narrator.narrate_event(_event(0.5, "sky"), 1, Age.ORDER)
+    assert text.endswith("\n  Echoes stir in the realm of the Heavens.")
@@ -1,6 +1,7 @@
 """Smoke test for Living Chronicle - runs 10 days with deterministic seed."""
 
 import os
+import shutil
 import tempfile
 import pytest
 
@@ -8,14 +9,29 @@ from chronicle.data import Database
 from chronicle.sim import SimulationEngine
 
 
-def test_smoke_10_days():
+@pytest.fixture(scope="module")
+def golden_db(tmp_path_factory):
+    """A freshly created world, built once; tests restore from copies of it."""
+    path = str(tmp_path_factory.mktemp("golden") / "golden.db")
+    engine = SimulationEngine(Database(path), seed=12345)
+    engine.initialize(fresh=True)
+    engine.shutdown()
+    return path
+
+
+def _restore_copy(golden_db, tmpdir, name, seed):
+    """Copy the golden world to tmpdir and restore an engine from it."""
+    db_path = os.path.join(tmpdir, name)
+    shutil.copyfile(golden_db, db_path)
+    engine = SimulationEngine(Database(db_path), seed=seed)
+    engine.initialize(fresh=False)
+    return engine
+
+
+def test_smoke_10_days(golden_db):
     """Run simulation for 10 days and verify basic functionality."""
     with tempfile.TemporaryDirectory() as tmpdir:
-        db_path = os.path.join(tmpdir, "test_smoke.db")
-        db = Database(db_path)
-
-        engine = SimulationEngine(db, seed=12345)
-        engine.initialize(fresh=True)
+        engine = _restore_copy(golden_db, tmpdir, "test_smoke.db", seed=12345)
 
         # Run for 10 days
         results = []
@@ -37,10 +53,7 @@ def test_smoke_10_days():
         assert engine.age_manager.current_age is not None
 
         # Verify determinism - run again with same seed
-        db2_path = os.path.join(tmpdir, "test_smoke2.db")
-        db2 = Database(db2_path)
-        engine2 = SimulationEngine(db2, seed=12345)
-        engine2.initialize(fresh=True)
+        engine2 = _restore_copy(golden_db, tmpdir, "test_smoke2.db", seed=12345)
 
         results2 = []
         for _ in range(10):
@@ -92,3 +105,61 @@ def test_smoke_persistence():
 
         assert engine2.current_day == 10
         engine2.shutdown()
+
+
+def test_citizen_beliefs_share_table_storage(golden_db):
+    """Per-citizen belief vectors are views of the engine's belief matrix."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = _restore_copy(golden_db, tmpdir, "test_table.db", seed=7)
+
+        table = engine.get_citizen_table()
+        citizens = engine.get_citizens()
+        assert table.beliefs.shape == (len(citizens), 6)
+
+        # Writes through the dict-style view land in the matrix...
+        citizens[0].row.belief_vector["flame"] = 0.75
+        assert table.beliefs[0, 1] == pytest.approx(0.75)
+
+        # ...and matrix updates are visible through the view
+        table.beliefs[:, 0] = 0.5
+        assert all(c.row.belief_vector["river"] == pytest.approx(0.5) for c in citizens)
+
+        engine.shutdown()
+
+
+def test_restore_reloads_saved_citizen_state(golden_db):
+    """A restart sees every citizen change and resumes the numpy stream."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine1 = _restore_copy(golden_db, tmpdir, "test_dirty.db", seed=42)
+        db_path = engine1.db.db_path
+        for _ in range(30):
+            engine1.tick()
+        assert not engine1.get_citizen_table().dirty.any()
+        before = engine1.get_citizen_table()
+        beliefs, fear = before.beliefs.copy(), before.fear.copy()
+        rng_state = engine1.np_rng.bit_generator.state
+        engine1.shutdown()
+
+        engine2 = SimulationEngine(Database(db_path), seed=42)
+        engine2.initialize(fresh=False)
+        after = engine2.get_citizen_table()
+        assert (after.beliefs == beliefs).all()
+        assert after.fear == pytest.approx(fear)
+        # The numpy stream resumes where it stopped rather than from the seed
+        assert engine2.np_rng.bit_generator.state == rng_state
+        engine2.shutdown()
+
+
+def test_marked_citizens_saved_on_shutdown(golden_db):
+    """Rows edited directly and marked dirty are written before closing."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = _restore_copy(golden_db, tmpdir, "test_mark.db", seed=42)
+        db_path = engine.db.db_path
+        engine.get_citizens()[0].row.belief_vector["memory"] = 0.9
+        engine.get_citizen_table().mark_dirty()
+        engine.shutdown()
+
+        db = Database(db_path)
+        db.connect()
+        assert db.get_all_citizens()[0].belief_vector["memory"] == pytest.approx(0.9)
+        db.close()